@@ -11,5 +11,28 @@ standard, but is meant to be implemented by a front-end app.
 Third-party dependencies are listed in requirements.txt.
 """
 
-import aop.aop
-import aop.tools
+from importlib import import_module
+
+from . import tools
+
+
+def __getattr__(name: str):
+    """
+    Imports the :mod:`aop.aop` module on first access.
+
+    Apps that only need the exceptions from :mod:`aop.tools` do not pay for importing the protocol writer
+    and its dependencies. ``from aop.aop import ...`` works just the same.
+
+    :param name: The name of the attribute requested from the package.
+    :type name: ``str``
+
+    :raises AttributeError: If ``name`` is neither "aop" nor an attribute of the package.
+
+    :return: The :mod:`aop.aop` module.
+    :rtype: ``module``
+    """
+    if name == "aop":
+        # import_module is used rather than 'from aop import aop', which would look the attribute up on this
+        # package again first. The import system stores the module as a package attribute, so this only runs once
+        return import_module("aop.aop")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,29 +4,210 @@
 
 This module contains the main classes and functions of the aop package.
 """
-import numpy
-from astropy.time import Time
 import json
+from ast import literal_eval
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from os import makedirs, path
-from uuid import uuid4
-
-# from aop.tools import *
-from tools import *
+from enum import IntEnum
+from functools import lru_cache
+import os
+from os import fstat, fsync, makedirs, path, remove, replace, stat, urandom
+from threading import Lock
+from time import monotonic, time as _unix_time
+from weakref import WeakSet
+import atexit
+import warnings
+
+# orjson serializes the .aol considerably faster, but is optional. The standard library's json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ciso8601 parses ISO 8601 time strings in C, but is optional. The standard library's parser is used otherwise
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# advisory file locking is only available on POSIX systems. Elsewhere, protocols are not locked
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from aop.tools import *
 
 # v2.x
-import xml.etree.ElementTree as ET
+# lxml parses and serializes considerably faster, but is optional. The standard library provides the same API
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 
 # v2.x END
 
 
-def current_jd(time: str = "current") -> numpy.float64:
+# the unique parts of observation and entry IDs are sliced from this pool of random bytes, so the
+# operating system's entropy source only has to be queried once every few hundred IDs
+_RAND_POOL_SIZE = 4096
+_rand_pool = urandom(_RAND_POOL_SIZE)
+_rand_pos = 0
+_rand_lock = Lock()
+
+
+def _reseed_rand_pool() -> None:
+    """
+    Replaces the random byte pool, so that forked processes do not hand out the same IDs as their parent.
+    """
+    global _rand_pool, _rand_pos
+    _rand_pool = urandom(_RAND_POOL_SIZE)
+    _rand_pos = 0
+
+
+# os.register_at_fork only exists on POSIX systems. Elsewhere, processes are not forked and nothing has to be reseeded
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_rand_pool)
+
+
+def _random_hex(digits: int) -> str:
+    """
+    Returns a random string of ``digits`` hexadecimal characters taken from the random byte pool.
+
+    :param digits: The number of hexadecimal characters to return.
+    :type digits: ``int``
+
+    :return: The random hexadecimal string.
+    :rtype: ``str``
+    """
+    global _rand_pool, _rand_pos
+    n_bytes = (digits + 1) // 2
+    with _rand_lock:
+        if _rand_pos + n_bytes > len(_rand_pool):
+            # refill the pool once it is used up
+            _rand_pool = urandom(max(_RAND_POOL_SIZE, n_bytes))
+            _rand_pos = 0
+        chunk = _rand_pool[_rand_pos:_rand_pos + n_bytes]
+        _rand_pos += n_bytes
+    return chunk.hex()[:digits]
+
+
+def _format_entry_timestamp(dt: datetime) -> str:
+    """
+    Formats a datetime as YYYYMMDDhhmmssffffff, as used in entry IDs.
+
+    This is equivalent to ``dt.strftime('%Y%m%d%H%M%S%f')``, but skips the locale-aware strftime machinery.
+
+    :param dt: The datetime to format.
+    :type dt: ``datetime``
+
+    :return: The formatted timestamp.
+    :rtype: ``str``
+    """
+    return "%04d%02d%02d%02d%02d%02d%06d" % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second,
+                                             dt.microsecond)
+
+
+def _fast_iso_parse(time: str) -> datetime:
+    """
+    Parses an ISO 8601 time string of the shape YYYY-MM-DD, YYYY-MM-DDThh:mm:ss or YYYY-MM-DDThh:mm:ss.ffffff
+    (with one to six fractional digits) into a UTC datetime.
+
+    This is a lot faster than the general-purpose parsers, since it only indexes directly into the string. Any string
+    of a different shape (e.g. one carrying a timezone offset) is rejected, so callers can fall back to those parsers.
+
+    :param time: The ISO 8601 time string to be parsed.
+    :type time: ``str``
+
+    :raises ValueError: If ``time`` is not of one of the shapes described above or does not represent a valid datetime.
+
+    :return: The corresponding timezone-aware UTC datetime.
+    :rtype: ``datetime``
+    """
+    length = len(time)
+    if length == 10:
+        if time[4] != "-" or time[7] != "-" or not (time[0:4] + time[5:7] + time[8:10]).isdigit():
+            raise ValueError(time)
+        return datetime(int(time[0:4]), int(time[5:7]), int(time[8:10]), tzinfo=timezone.utc)
+
+    if length == 19:
+        fraction = "0"
+    elif 21 <= length <= 26 and time[19] == ".":
+        fraction = time[20:]
+    else:
+        raise ValueError(time)
+    if time[4] != "-" or time[7] != "-" or time[10] != "T" or time[13] != ":" or time[16] != ":" or not \
+            (time[0:4] + time[5:7] + time[8:10] + time[11:13] + time[14:16] + time[17:19] + fraction).isdigit():
+        raise ValueError(time)
+    return datetime(int(time[0:4]), int(time[5:7]), int(time[8:10]), int(time[11:13]), int(time[14:16]),
+                    int(time[17:19]), int(fraction.ljust(6, "0")), tzinfo=timezone.utc)
+
+
+# the Unix epoch, 1970-01-01T00:00:00 UTC, corresponds to JD 2440587.5
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_UNIX_EPOCH_JD = 2440587.5
+
+
+def _datetime_to_jd(dt: datetime) -> float:
+    """
+    Converts a timezone-aware UTC datetime to a Julian Date arithmetically.
+
+    :param dt: The datetime to be converted.
+    :type dt: ``datetime``
+
+    :return: The corresponding Julian Date.
+    :rtype: ``float``
+    """
+    delta = dt - _UNIX_EPOCH
+    return _UNIX_EPOCH_JD + delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400.0
+
+
+@lru_cache(maxsize=1024)
+def _iso_to_jd(time: str):
+    """
+    Converts an ISO 8601 time string to a Julian Date.
+
+    Results are memoized, so that implementations repeatedly passing the same custom time (e.g. when
+    replaying or digitizing a protocol) only pay for the conversion once. This includes invalid strings,
+    which would otherwise be handed to astropy again every time. No exception is cached, though: the
+    caller raises a fresh one, so its traceback always describes the call at hand.
+
+    :param time: An ISO 8601 conform string of the UTC datetime to be converted.
+    :type time: ``str``
+
+    :return: The Julian Date corresponding to the datetime provided, or None if ``time`` is not interpretable
+        as representing a time to astropy.time.Time.
+    :rtype: ``float`` or ``None``
+    """
+    try:
+        return _datetime_to_jd(_fast_iso_parse(time))
+    except ValueError:
+        pass
+    try:
+        # other ISO 8601 shapes, e.g. with a UTC offset, are still understood by ciso8601 or the standard library.
+        # Naive datetimes are taken to be UTC
+        dt = _parse_iso(time)
+        dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+        return _datetime_to_jd(dt)
+    except ValueError:
+        # anything else is left to astropy. It takes a considerable time to import, so this is only done once it is
+        # actually needed
+        pass
+    from astropy.time import Time
+    try:
+        return Time([time], format="isot", scale="utc").jd[0].item()
+    except ValueError:
+        return None
+
+
+def current_jd(time: str = "current") -> float:
     """
     Returns the Julian Date for the current UTC or a custom datetime.
 
-    It makes use of astropy's ``Time`` class to represent the datetime given as
-    a Julian Date.
+    The current time and time strings understood by :func:`_fast_iso_parse`, ciso8601 (if installed) or
+    ``datetime.fromisoformat`` are converted arithmetically, every other string is handed to astropy's ``Time``
+    class to represent the datetime given as a Julian Date.
 
     :param time: An ISO 8601 conform string of the UTC datetime you want to be converted
         to a Julian Date. If ``time`` is "current", the current UTC
@@ -38,26 +219,66 @@ def current_jd(time: str = "current") -> numpy.float64:
         representing a time to astropy.time.Time.
 
     :return: The Julian Date corresponding to the datetime provided.
-    :rtype: ``numpy.float64``
+    :rtype: ``float``
     """
 
     if time == "current":
-        # if the current time is requested, return current Julian Date.
-        return Time.now().jd
+        # if the current time is requested, return current Julian Date. Days since the Unix epoch are simply counted
+        # on from the epoch's Julian Date
+        return _unix_time() / 86400.0 + _UNIX_EPOCH_JD
     else:
         if isinstance(time, str):
             # check whether time is a string, like astropy.time.core.Time expects.
             # if so, return the corresponding Julian Date
-            try:
-                return Time([time], format="isot", scale="utc").jd[0]
-            except ValueError:
+            jd = _iso_to_jd(time)
+            if jd is None:
                 raise InvalidTimeStringError(time)
+            return jd
         else:
             # if not, demand users put in a string.
             raise TypeError("Please pass a string as 'time' argument, formatted as ISO 8601 time, in UTC, or 'current' "
                             "to use current time")
 
 
+def current_jd_batch(times: list) -> "numpy.ndarray":
+    """
+    Returns the Julian Dates for a whole list of custom datetimes at once.
+
+    This is meant for tools replaying or digitizing existing protocols, where many time strings have to be
+    converted. Lists that numpy can parse completely are converted in one vectorized operation, all others are
+    converted string by string using :func:`current_jd`.
+
+    :param times: ISO 8601 conform strings of the UTC datetimes you want to be converted to Julian Dates.
+        "current" may be used for the current UTC datetime.
+    :type times: ``list[str]``
+
+    :raises TypeError: If any of the ``times`` is not of type ``str``.
+    :raises InvalidTimeStringError: If any of the ``times`` is of type ``str`` but not interpretable as
+        representing a time to astropy.time.Time.
+
+    :return: The Julian Dates corresponding to the datetimes provided, in the same order.
+    :rtype: ``numpy.ndarray``
+    """
+    # numpy takes a moment to import and is not needed for anything else, so it is only imported here
+    import numpy
+    times = list(times)
+    # numpy also accepts strings current_jd() rejects, e.g. partial dates like "2024", "NaT" or "now", and misreads
+    # others like "20240101". Only lists of strings starting with a complete YYYY-MM-DD date are handed to it
+    if all(isinstance(time, str) and len(time) >= 10 and time[4] == "-" and time[7] == "-" and
+           (time[0:4] + time[5:7] + time[8:10]).isdigit() for time in times):
+        try:
+            with warnings.catch_warnings():
+                # numpy warns about UTC offsets (including "Z") instead of rejecting them, such strings are left
+                # to the fallback below
+                warnings.simplefilter("error")
+                stamps = numpy.asarray(times, dtype="datetime64[us]")
+        except (ValueError, Warning):
+            pass
+        else:
+            return (stamps - numpy.datetime64(0, "us")) / numpy.timedelta64(1, "D") + _UNIX_EPOCH_JD
+    return numpy.fromiter((current_jd(time) for time in times), dtype=numpy.float64, count=len(times))
+
+
 def generate_observation_id(digits: int = 10) -> str:
     """
     This function generates a unique observation ID.
@@ -79,7 +300,9 @@ def generate_observation_id(digits: int = 10) -> str:
     :return: The generated observation ID.
     :rtype: ``str``
     """
-    return f"{datetime.now(timezone.utc).strftime('%Y-%m-%d-%H-%M-%S')}-{uuid4().hex[:digits]}"
+    now = datetime.now(timezone.utc)
+    return "%04d-%02d-%02d-%02d-%02d-%02d-%s" % (now.year, now.month, now.day, now.hour, now.minute, now.second,
+                                                 _random_hex(digits))
 
 
 def create_entry_id(time: str = "current", digits: int = 30) -> str:
@@ -115,15 +338,21 @@ def create_entry_id(time: str = "current", digits: int = 30) -> str:
     if time == "current":
         # if current time is used, return an entryID, consisting of the current
         # UTC and a digits-long unique identifier.
-        return f"{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}-{uuid4().hex[:digits]}"
+        return f"{_format_entry_timestamp(datetime.now(timezone.utc))}-{_random_hex(digits)}"
     else:
         # if not, check whether time is a string, like
-        # datetime.datetime.fromisoformat demands.
+        # the ISO 8601 parsers demand.
         if isinstance(time, str):
             # if so, return an entryId using the time provided
             try:
-                timestring = datetime.fromisoformat(time)
-                return f"{timestring.strftime('%Y%m%d%H%M%S%f')}-{uuid4().hex[:digits]}"
+                try:
+                    timestring = _fast_iso_parse(time)
+                except ValueError:
+                    timestring = _parse_iso(time)
+                    # times with a UTC offset are stamped in UTC, just like current_jd() converts them
+                    if timestring.tzinfo is not None:
+                        timestring = timestring.astimezone(timezone.utc)
+                return f"{_format_entry_timestamp(timestring)}-{_random_hex(digits)}"
             except ValueError:
                 raise InvalidTimeStringError(time)
         else:
@@ -132,6 +361,294 @@ def create_entry_id(time: str = "current", digits: int = 30) -> str:
                             "to use current time")
 
 
+def _jd_and_entry_id(time: str = "current") -> tuple:
+    """
+    Returns both the Julian Date and a new entry ID for a protocol entry.
+
+    For the current time, both values are derived from one single reading of the clock, so the
+    entry ID and the Julian Date of an entry always describe the same instant.
+
+    :param time: An ISO 8601 conform string of the UTC datetime of the entry, or "current" to use
+        the current UTC datetime, defaults to "current".
+    :type time: ``str``, optional
+
+    :raises TypeError: If ``time`` is not a string.
+    :raises InvalidTimeStringError: If ``time`` is neither "current" nor a valid time string.
+
+    :return: The Julian Date and the entry ID, in that order.
+    :rtype: ``tuple[float, str]``
+    """
+    if time == "current":
+        now = datetime.now(timezone.utc)
+        return _datetime_to_jd(now), f"{_format_entry_timestamp(now)}-{_random_hex(30)}"
+    jd = current_jd(time)
+    try:
+        return jd, create_entry_id(time)
+    except InvalidTimeStringError:
+        # astropy understands some times a datetime cannot represent, e.g. the leap second 2016-12-31T23:59:60. Their
+        # entries are given an ID of the current time instead, as every entry used to be
+        return jd, create_entry_id()
+
+
+def _validate_list_of_gear(list_of_gear: list) -> list:
+    """
+    Makes sure the ``listOfGear`` keyword argument of :class:`Session` is a list.
+
+    :param list_of_gear: The value passed as ``listOfGear``.
+    :type list_of_gear: ``list``
+
+    :raises TypeError: If ``list_of_gear`` is not of type ``list``.
+
+    :return: The unchanged list.
+    :rtype: ``list``
+    """
+    if not isinstance(list_of_gear, list):
+        raise TypeError("Please provide a list object for the 'listOfGear' argument!")
+    return list_of_gear
+
+
+def _validate_digitized(digitized: bool) -> bool:
+    """
+    Makes sure the ``digitized`` keyword argument of :class:`Session` is a bool.
+
+    :param digitized: The value passed as ``digitized``.
+    :type digitized: ``bool``
+
+    :raises TypeError: If ``digitized`` is not of type ``bool``.
+
+    :return: The unchanged flag.
+    :rtype: ``bool``
+    """
+    if not isinstance(digitized, bool):
+        raise TypeError("Please provide a bool for the 'digitized' argument!")
+    return digitized
+
+
+# the keyword arguments recognized by the Session constructor, each mapped to the callable validating and
+# converting its value, or to None if the value is stored as is
+_VALIDATORS = {
+    "name": None,
+    "observer": None,
+    "locationDescription": None,
+    "longitude": float,
+    "latitude": float,
+    "transcription": None,
+    "listOfGear": _validate_list_of_gear,
+    "project": None,
+    "target": None,
+    "commentary": None,
+    "digitized": _validate_digitized,
+    "objective": None,
+    "digitizer": None,
+}
+
+# the issue severities recognized by Session.issue(), each alias mapped to the severity it stands for
+_ISSUE_SEVERITIES = {
+    "potential": "potential",
+    "p": "potential",
+    "normal": "normal",
+    "n": "normal",
+    "major": "major",
+    "m": "major",
+}
+
+# the frame types recognized by Session.take_frame(), each alias mapped to the frame type it stands for.
+# "sc" has always been accepted for science frames, "sf" is the alias documented alongside the other types
+_FRAME_TYPES = {
+    "science": "science",
+    "science frame": "science",
+    "s": "science",
+    "sc": "science",
+    "sf": "science",
+    "dark": "dark",
+    "dark frame": "dark",
+    "d": "dark",
+    "df": "dark",
+    "flat": "flat",
+    "flat frame": "flat",
+    "f": "flat",
+    "ff": "flat",
+    "bias": "bias",
+    "bias frame": "bias",
+    "b": "bias",
+    "bf": "bias",
+    "pointing": "pointing",
+    "pointing frame": "pointing",
+    "p": "pointing",
+    "pf": "pointing",
+}
+
+# the types accepted for condition measurements
+_NUMERIC = (int, float)
+
+# the arguments of Session.take_frame() in order of their type check, each with its required type and how the
+# error message describes it
+_FRAME_ARGUMENT_TYPES = (
+    ("n", int, "an integer as frame number"),
+    ("ftype", str, "a string as frame type"),
+    ("expt", float, "a float as exposure time"),
+    ("ap", float, "a float as aperture"),
+    ("iso", int, "an integer as ISO value"),
+)
+
+
+class SessionState(IntEnum):
+    """
+    The states an observing session can be in once it has been started.
+
+    States are logged by their lowercase name, e.g. "running", so existing protocols remain compatible.
+    """
+
+    RUNNING = 1
+    ABORTED = 2
+    ENDED = 3
+
+    def __str__(self) -> str:
+        """
+        A SessionState is represented by its lowercase name.
+
+        :return: The lowercase name of the state, e.g. "running".
+        :rtype: ``str``
+        """
+        return self.name.lower()
+
+    @classmethod
+    def from_string(cls, state):
+        """
+        Restores a session state from its logged representation.
+
+        :param state: The logged state, e.g. "running". "None" or None represent a session that has not been started.
+        :type state: ``str``
+
+        :raises KeyError: If ``state`` does not name a session state.
+
+        :return: The corresponding session state, or None.
+        :rtype: :class:`SessionState` or ``None``
+        """
+        if state is None or state == "None":
+            return None
+        return cls[state.upper()]
+
+
+# sessions whose logged events have not been synced to disk yet. These are synced when the interpreter exits
+_unflushed_sessions = WeakSet()
+
+
+@atexit.register
+def _flush_unflushed_sessions() -> None:
+    """
+    Syncs the logged events of every session to disk before the interpreter exits.
+    """
+    for session in list(_unflushed_sessions):
+        session._flush_on_exit()
+
+
+@contextmanager
+def _locked(file, shared: bool = False):
+    """
+    Holds an advisory lock on an open file for the duration of a ``with`` block.
+
+    This keeps processes sharing a session, e.g. a GUI front-end and a command line tool, from reading a journal
+    while another one is writing or removing it. On systems without ``fcntl``, no lock is taken. Closing the file
+    within the block releases the lock as well.
+
+    :param file: The open file to lock.
+    :type file: file object
+    :param shared: Whether to take a shared (reading) rather than an exclusive (writing) lock, defaults to False.
+    :type shared: ``bool``, optional
+    """
+    if fcntl is None:
+        yield file
+        return
+    fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    try:
+        yield file
+    finally:
+        if not file.closed:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def _dumps_parameter_log(parameters: dict) -> bytes:
+    """
+    Serializes the parameters of the .aol legacy parameter log to indented JSON.
+
+    :param parameters: The parameters to be logged.
+    :type parameters: ``dict``
+
+    :return: The UTF-8 encoded JSON document.
+    :rtype: ``bytes``
+    """
+    if orjson is not None:
+        return orjson.dumps(parameters, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(parameters, indent=4).encode("utf-8")
+
+
+def _text_element(tag: str, text) -> ET.Element:
+    """
+    Creates a detached element holding the string representation of ``text``.
+
+    :param tag: The tag of the element.
+    :type tag: ``str``
+    :param text: The content of the element.
+    :type text: any
+
+    :return: The new element.
+    :rtype: ``xml.etree.ElementTree.Element``
+    """
+    element = ET.Element(tag)
+    element.text = str(text)
+    return element
+
+
+def _replay_journal(session_root: ET.Element, journal) -> None:
+    """
+    Adds the events of a .aop.journal to a protocol's root element.
+
+    A journaled parameters tag replaces the one currently held by the protocol. Events the protocol already holds
+    are skipped, since a crash between composing the .aop and removing the journal leaves both behind.
+
+    :param session_root: The root element (session) of the protocol.
+    :type session_root: ``xml.etree.ElementTree.Element``
+    :param journal: The journal, opened for reading in binary mode. The caller is responsible for locking it.
+    :type journal: file object
+    """
+    logged_ids = {element.get("id") for element in session_root if element.get("id") is not None}
+    for line in journal:
+        try:
+            element = ET.fromstring(line)
+        except ET.ParseError:
+            # a line cut short by a crash cannot be recovered
+            continue
+        if element.tag == "parameters":
+            parameters_tag = session_root.find("parameters")
+            if parameters_tag is not None:
+                # keep the parameters tag where it is
+                index = list(session_root).index(parameters_tag)
+                session_root.remove(parameters_tag)
+                session_root.insert(index, element)
+                continue
+        elif element.get("id") in logged_ids:
+            continue
+        session_root.append(element)
+
+
+def _file_id(file_stat) -> tuple:
+    """
+    Identifies a file on disk, so that replacing it with another file can be detected.
+
+    :param file_stat: The result of ``os.stat()`` or ``os.fstat()`` for the file.
+    :type file_stat: ``os.stat_result``
+
+    :return: The device and inode number of the file.
+    :rtype: ``tuple[int, int]``
+    """
+    return file_stat.st_dev, file_stat.st_ino
+
+
+# a sentinel marking optional Session attributes that have not been set
+_UNSET = object()
+
+
 class Session:
     """
     A class representing an astronomical observing session.
@@ -140,6 +657,18 @@ class Session:
     actions and events that occur throughout an astronomical observation.
     """
 
+    _PARAM_KEYS = ("started", "obsID", "filepath", *_VALIDATORS, "state", "interrupted", "conditionDescription",
+                   "temp", "pressure", "humidity")
+    """The names of all observation parameters, in the order they are logged."""
+
+    WRITE_LEGACY_FILES = False
+    """Whether the deprecated v1.x .aopl protocol and .aol parameter log are written alongside the .aop. Set
+    ``Session.WRITE_LEGACY_FILES = True`` before starting a session if your application still reads them."""
+
+    __slots__ = _PARAM_KEYS + ("_path_stem", "_aopl_fp", "_journal_fp", "_pending", "_aop_id", "_tree", "_root",
+                               "_parameters_tag", "_parameters_text", "_dirty", "_last_flush", "_flush_interval",
+                               "__weakref__")
+
     def __init__(self, filepath: str, **kwargs) -> None:
         r"""
         Constructor method for the :class:`Session` class.
@@ -216,73 +745,26 @@ class Session:
         """The path where the implementing script wants aop to store its files. This could be a part of the implementing 
         script's installation directory, for example."""
 
-        # if the keyword arguments provided are recognized, store their values
-        # as attributes
-        if "name" in kwargs:
-            self.name = kwargs["name"]
-
-        if "observer" in kwargs:
-            self.observer = kwargs["observer"]
-
-        if "locationDescription" in kwargs:
-            self.locationDescription = kwargs["locationDescription"]
-
-        if "longitude" in kwargs:
-            if type(kwargs["longitude"]) == float:
-                self.longitude = kwargs["longitude"]
-            else:
-                self.longitude = float(kwargs["longitude"])
-
-        if "latitude" in kwargs:
-            if type(kwargs["latitude"]) == float:
-                self.latitude = kwargs["latitude"]
-            else:
-                self.latitude = float(kwargs["latitude"])
-
-        if "transcription" in kwargs:
-            self.transcription = kwargs["transcription"]
-
-        if "listOfGear" in kwargs:
-            if type(kwargs["listOfGear"]) == list:
-                self.listOfGear = kwargs["listOfGear"]
-            else:
-                raise TypeError("Please provide a list object for the 'listOfGear' argument!")
-
-        if "project" in kwargs:
-            self.project = kwargs["project"]
-
-        if "target" in kwargs:
-            self.target = kwargs["target"]
-
-        if "commentary" in kwargs:
-            self.commentary = kwargs["commentary"]
-
-        if "digitized" in kwargs:
-            if kwargs["digitized"]:
-                self.digitized = True
-            elif not kwargs["digitized"]:
-                self.digitized = False
-            else:
-                raise TypeError("Please provide a boolean value as 'digitized' argument!")
+        # if the keyword arguments provided are recognized, store their (validated) values
+        # as attributes. Values restored by parse_session() have been decoded from the protocol already, and are kept
+        # as they are even if they could not be restored completely, e.g. a listOfGear holding dates
+        for key, value in kwargs.items():
+            if key in _VALIDATORS:
+                validator = _VALIDATORS[key]
+                setattr(self, key, value if validator is None or "parsing" in kwargs else validator(value))
 
-        if "objective" in kwargs:
-            self.objective = kwargs["objective"]
-
-        if "digitizer" in kwargs:
-            self.digitizer = kwargs["digitizer"]
-
-        # add more keyword arguments here if necessary
+        # add more keyword arguments to _VALIDATORS if necessary
 
         if "parsing" not in kwargs:
             self.state = None
             """A status flag indicating the current status of the observing session.
             The class methods set this flag to either
-                * "running",
-                * "aborted" or
-                * "ended".
-            Initialized in ``__init__()`` to None, updated in ``start()`` to "running"."""
+                * SessionState.RUNNING,
+                * SessionState.ABORTED or
+                * SessionState.ENDED.
+            Initialized in ``__init__()`` to None, updated in ``start()`` to SessionState.RUNNING."""
         else:
-            self.state = kwargs["state"]
+            self.state = SessionState.from_string(kwargs["state"])
 
         if "parsing" not in kwargs:
             self.interrupted = False
@@ -307,15 +789,60 @@ class Session:
         # self.parameters["humidity"] = self.humidity
         # self.parameters["started"] = self.started
 
-        self.conditionDescription = None
+        # the observing conditions are only ever set by condition_report(). A restored session keeps the ones last
+        # reported, though, so they are not overwritten with None the next time the parameters are logged
+        restored = "parsing" in kwargs
+        self.conditionDescription = kwargs.get("conditionDescription") if restored else None
         """A short description of the observing conditions."""
-        self.temp = None
+        self.temp = kwargs.get("temp") if restored else None
         """The temperature at the observing site in °C."""
-        self.pressure = None
+        self.pressure = kwargs.get("pressure") if restored else None
         """The air pressure at the observing site in hPa."""
-        self.humidity = None
+        self.humidity = kwargs.get("humidity") if restored else None
         """The air humidity at the observing site in %."""
 
+        self._path_stem = None if self.obsID is None else path.join(self.filepath, self.obsID, self.obsID)
+        """The path shared by the session's files, lacking only their extension. Cached once the observation ID
+        is known, so that event methods do not have to join it again on every call."""
+        self._aopl_fp = None
+        """The file object of the .aopl legacy protocol, kept open while the session is running."""
+
+        self._tree = None
+        """The element tree of the .aop protocol, kept in memory so it only has to be parsed once."""
+        self._root = None
+        """The root element (session) of ``_tree``."""
+        self._journal_fp = None
+        """The file object of the .aop.journal, kept open while the session is running. Events are appended to it
+        one fragment per line, and only composed into the .aop once the session is over."""
+        self._pending = []
+        """The serialized events of the event currently being logged, one line each, until they are written to the
+        journal."""
+        self._aop_id = None
+        """The device and inode number of the .aop as last written or read by this instance. Another Session handle
+        composing the protocol replaces the file, which this is compared against before writing to the journal."""
+        self._parameters_tag = None
+        """The parameters element of ``_tree``, updated in place whenever the observation parameters change."""
+        self._parameters_text = {}
+        """The text last written to each sub-tag of the parameters tag, used to skip unchanged parameters."""
+        self._dirty = False
+        """Whether the journal or the .aopl hold events that have been written, but not synced to disk yet."""
+        self._last_flush = monotonic()
+        """The time the journal was last synced to disk, as returned by ``time.monotonic()``."""
+        self._flush_interval = 1.0
+        """The minimum time in seconds between two syncs of the journal to disk. Every event is written to the
+        journal right away, only the costly ``fsync`` is shared by all events logged in between."""
+
+    def __del__(self) -> None:
+        """
+        Makes sure logged events are synced to disk before the session is garbage-collected.
+        """
+        if getattr(self, "_dirty", False) or getattr(self, "_pending", None):
+            self._flush_on_exit()
+        if getattr(self, "_journal_fp", None) is not None:
+            self._close_journal()
+        if getattr(self, "_aopl_fp", None) is not None:
+            self._close_aopl()
+
     def __repr__(self) -> str:
         """
         A Session object is represented by its attributes.
@@ -324,11 +851,48 @@ class Session:
             in line format.
         :rtype: ``str``
         """
-        return_str = ""
-        for i in self.__dict__:
-            if not i == "parameters":
-                return_str += f"{i}: {self.__dict__[i]}\n"
-        return return_str
+        return "".join(f"{i}: {value}\n" for i, value in self._observation_parameters().items())
+
+    @property
+    def parameters(self) -> dict:
+        """
+        The session's observation parameters, as they are logged to the protocol.
+
+        Up to v1.x, every Session held a ``parameters`` dictionary duplicating its attributes, which had to be
+        kept in sync by hand. It is now assembled from the attributes on every access instead, so it can never
+        drift from them. Changing the returned dictionary does not change the session.
+
+        :return: A dictionary mapping each parameter name to its value.
+        :rtype: ``dict``
+        """
+        return self._observation_parameters()
+
+    def _observation_parameters(self) -> dict:
+        """
+        Collects the session's observation parameters, as listed in ``_PARAM_KEYS``.
+
+        Optional parameters that were not passed to the constructor are left out. Private attributes
+        hold internal state like open file objects and are therefore never logged.
+
+        :return: A dictionary mapping each parameter name to its value.
+        :rtype: ``dict``
+        """
+        parameters = {}
+        for key in self._PARAM_KEYS:
+            value = getattr(self, key, _UNSET)
+            if value is not _UNSET:
+                parameters[key] = value
+        return parameters
+
+    def _close_aopl(self) -> None:
+        """
+        Closes the .aopl legacy protocol file, if it is currently open.
+        """
+        if self._aopl_fp is not None:
+            try:
+                self._aopl_fp.close()
+            finally:
+                self._aopl_fp = None
 
     def start(self, time: str = "current") -> None:
         """
@@ -337,7 +901,7 @@ class Session:
         By not starting the observation when a Session object is created, it is
         possible to prepare the Session object pre-observation as well as
         parse existing protocols from memory into a new Session object. It
-        changes the Session's "state" flag to "running", as well as generating
+        changes the Session's "state" flag to SessionState.RUNNING, as well as generating
         an observation ID, setting up a directory for the protocol to live in, and writing
         the initial files to that directory.
 
@@ -350,11 +914,29 @@ class Session:
             .aop file.
         :raises AopFileAlreadyExistsError: If the .aop file the method tries to create already exists.
         :raises AopFileAlreadyExistsError: If the .aopl file the method tries to create for legacy only already exists.
+            Only checked if ``WRITE_LEGACY_FILES`` is set.
         :raises AolFileAlreadyExistsError: If the .aol file the method tries to create for legacy only already exists.
+            Only checked if ``WRITE_LEGACY_FILES`` is set.
         """
 
+        # read the clock only once, so all files agree on when the session started
+        jd, entry_id = _jd_and_entry_id(time)
+
+        # starting an instance again begins a new protocol. Everything belonging to the previous one is synced to disk
+        # and let go of first, so that no event or parameter ends up in the wrong protocol
+        if self._dirty:
+            self._flush_on_exit()
+        self._close_journal()
+        self._close_aopl()
+        self._pending.clear()
+        self._aop_id = None
+        self._tree = None
+        self._root = None
+        self._parameters_tag = None
+        self._parameters_text = {}
+
         # initialize session's state to "running"
-        self.state = "running"
+        self.state = SessionState.RUNNING
         # self.parameters["state"] = "running"
 
         self.started = True
@@ -363,53 +945,64 @@ class Session:
         # generate a unique observation ID and update the as of now empty attribute.
         self.obsID = generate_observation_id()
         # self.parameters["obsID"] = self.obsID
+        self._path_stem = path.join(self.filepath, self.obsID, self.obsID)
 
         # create the directory where the session's data will be stored
-        makedirs(self.filepath + "/" + str(self.obsID), exist_ok=True)
+        makedirs(path.join(self.filepath, self.obsID), exist_ok=True)
 
         # check whether the protocol file already exists
-        if path.exists(f"{self.filepath}/{self.obsID}/{self.obsID}.aop"):
+        if path.exists(f"{self._path_stem}.aop"):
             raise AopFileAlreadyExistsError(self.filepath, self.obsID)
 
         # v1.x START
         # Despite this being deprecated, the sections writing the plain-text logs are still in the code
         # for legacy reasons and in case anything should break. The only changes that have been made to
         # the v1.x code as of v2.0 is replacing the .aop file extension with .aopl (for legacy) and
-        # discontinuing the usage of self.parameters in favour of self.__dict__.
+        # discontinuing the usage of self.parameters in favour of the session's attributes.
 
-        # check whether the legacy protocol files already exist
-        if path.exists(f"{self.filepath}/{self.obsID}/{self.obsID}.aopl"):
-            raise AopFileAlreadyExistsError(self.filepath, self.obsID)
-        if path.exists(f"{self.filepath}/{self.obsID}/{self.obsID}.aol"):
-            raise AolFileAlreadyExistsError(self.filepath, self.obsID)
+        # the legacy files are only written if requested
+        if self.WRITE_LEGACY_FILES:
+            # check whether the legacy protocol files already exist
+            if path.exists(f"{self._path_stem}.aopl"):
+                raise AopFileAlreadyExistsError(self.filepath, self.obsID)
+            if path.exists(f"{self._path_stem}.aol"):
+                raise AolFileAlreadyExistsError(self.filepath, self.obsID)
 
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aopl", "wt") as f:
-                # start each .aop file with the static observation parameters
-                for i in self.__dict__:  # line used to say: 'for i in self.parameters:'
-
-                    # do not print these flags, as they are subject to change
-                    if i not in ["state", "interrupted"]:
-                        f.write(f"{i}: {self.__dict__[i]}\n")
-                        # previous line used to say: 'f.write(f"{i}: {self.parameters[i]}\n")'
-
-                # add an extra new line to indicate the main protocol beginning.
-                f.write("\n")
-
-                # Session Event: The observation started. Check with the AOP
-                # Syntax Guide for reference.
-                f.write(f"({create_entry_id()}) {current_jd(time):.10f} -> SEEV SESSION "
-                        f"{self.obsID} STARTED\n")
-        except PermissionError:
-            raise PermissionError("Error when writing to .aopl: You do not have the adequate access rights!")
+            try:
+                # the .aopl stays open for the whole session, so that each entry only costs a single write
+                self._aopl_fp = open(f"{self._path_stem}.aopl", "wb", buffering=65536)
+            except PermissionError:
+                raise PermissionError("Error when writing to .aopl: You do not have the adequate access rights!")
 
-        # create or overwrite the parameter and flags log. This is a JSON file.
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aol", "w") as f:
-                f.write(json.dumps(self.__dict__, indent=4))
-                # previous line used to say: 'f.write(json.dumps(self.parameters, indent=4))'
-        except PermissionError:
-            raise PermissionError("Error when writing to .aol: You do not have the adequate access rights!")
+            header = ""
+            # start each .aop file with the static observation parameters
+            for i, value in self._observation_parameters().items():  # line used to say: 'for i in self.parameters:'
+
+                # do not print these flags, as they are subject to change
+                if i not in ["state", "interrupted"]:
+                    header += f"{i}: {value}\n"
+                    # previous line used to say: 'f.write(f"{i}: {self.parameters[i]}\n")'
+
+            # add an extra new line to indicate the main protocol beginning.
+            header += "\n"
+
+            # Session Event: The observation started. Check with the AOP
+            # Syntax Guide for reference.
+            header += f"({entry_id}) {jd:.10f} -> SEEV SESSION {self.obsID} STARTED\n"
+
+            self._aopl_fp.write(header.encode("utf-8"))
+            self._aopl_fp.flush()
+
+            # create or overwrite the parameter and flags log. This is a JSON file.
+            try:
+                with open(f"{self._path_stem}.aol", "wb") as f:
+                    parameters = self._observation_parameters()
+                    # states are logged by name rather than by their integer value
+                    parameters["state"] = str(parameters["state"])
+                    f.write(_dumps_parameter_log(parameters))
+                    # previous line used to say: 'f.write(json.dumps(self.parameters, indent=4))'
+            except PermissionError:
+                raise PermissionError("Error when writing to .aol: You do not have the adequate access rights!")
         # v1.x END
 
         # v2.x START
@@ -420,33 +1013,389 @@ class Session:
         session_root = ET.Element("session")
 
         # this will be where all the session parameters and metadata live
-        parameters_subelement = ET.SubElement(session_root, "parameters")
-
-        # populate the parameters sub-element with all the available metadata
-        for i in self.__dict__:  # line used to say: 'for i in self.parameters:'
-            current_parameter = ET.SubElement(parameters_subelement, i)
-            current_parameter.text = str(self.__dict__[i])
-            # previous line used to say: 'current_parameter.text = str(self.parameters[i])'
+        self._update_parameters(session_root)
 
         # log the session starting
         session_starts_subelement = ET.SubElement(session_root, "start")
         # record entry id and julian date as attributes
-        session_starts_subelement.set("time", str(current_jd(time)))
-        session_starts_subelement.set("id", str(create_entry_id()))
+        session_starts_subelement.set("time", str(jd))
+        session_starts_subelement.set("id", entry_id)
+
+        # keep the protocol in memory, so that events do not need to parse it again...
+        self._tree = ET.ElementTree(session_root)
+        self._root = session_root
+
+        # ...and write it to file right away. All further events are appended to the journal
+        self._write_protocol()
+        # v2.x END
+
+    def _load_protocol(self) -> ET.Element:
+        """
+        Returns the root element of the session's .aop protocol.
+
+        The protocol is only parsed from file the first time this is called on a session restored by
+        :func:`parse_session`, replaying the events of a journal left behind by a session that has not
+        been ended yet. Afterwards, and for sessions started by this instance, the element tree held in
+        memory is used and mutated directly.
+
+        :raises SessionStateError: If another Session handle has ended or aborted the session since it was restored.
+
+        :return: The root element (session) of the protocol.
+        :rtype: ``xml.etree.ElementTree.Element``
+        """
+        if self._root is None:
+            aop_path = f"{self._path_stem}.aop"
+            with open(aop_path, "rb") as protocol:
+                aop_id = _file_id(fstat(protocol.fileno()))
+                # a session restored by parse_session() knows which .aop it was restored from. If that has been
+                # replaced since, another Session handle has ended or aborted the session in the meantime
+                if self._aop_id is not None and aop_id != self._aop_id:
+                    raise self._discard_pending()
+                self._aop_id = aop_id
+                self._tree = ET.parse(protocol)
+            self._root = self._tree.getroot()
+            try:
+                with open(f"{aop_path}.journal", "rb") as journal, _locked(journal, shared=True):
+                    _replay_journal(self._root, journal)
+            except FileNotFoundError:
+                pass
+        return self._root
+
+    def _journal(self, *elements: ET.Element, force: bool = False) -> None:
+        """
+        Appends event elements to the .aop.journal, one serialized fragment per line.
+
+        Unlike rewriting the .aop, this only costs as many bytes as the new events take up. The fragments are
+        written to the journal right away, but only synced to disk once the flush interval has passed.
+
+        :param elements: The elements to append, in order.
+        :type elements: ``xml.etree.ElementTree.Element``
+        :param force: Whether to sync them to disk right away rather than with the next batch, defaults to False.
+        :type force: ``bool``, optional
+
+        :raises PermissionError: If the user does not have the adequate access rights for writing to the journal.
+        :raises SessionStateError: If another Session handle has ended or aborted the session in the meantime.
+        """
+        for element in elements:
+            self._pending.append(ET.tostring(element, encoding="UTF-8", xml_declaration=False) + b"\n")
+        self._flush(force)
+
+    def _open_journal(self):
+        """
+        Returns the session's .aop.journal, opening it for appending first if necessary.
+
+        :raises PermissionError: If the user does not have the adequate access rights for writing to the journal.
+
+        :return: The journal, opened for appending in binary mode.
+        :rtype: file object
+        """
+        if self._journal_fp is None:
+            try:
+                self._journal_fp = open(f"{self._path_stem}.aop.journal", "ab")
+            except PermissionError:
+                raise PermissionError("Error when writing to .aop.journal: You do not have the adequate access "
+                                      "rights!")
+        return self._journal_fp
+
+    def _close_journal(self) -> None:
+        """
+        Closes the .aop.journal, if it is currently open.
+        """
+        if self._journal_fp is not None:
+            try:
+                self._journal_fp.close()
+            finally:
+                self._journal_fp = None
 
-        # convert xml to byte object
-        byte_xml = ET.tostring(session_root, encoding="UTF-8")
+    def _journal_is_current(self, journal) -> bool:
+        """
+        Checks whether the protocol is still the one this instance last read or wrote, and its journal still in use.
+
+        Another Session handle ending or aborting the session composes the .aop anew and removes the journal. Events
+        written to the journal afterwards would never reach the protocol. Must be called while holding the journal's
+        lock.
 
+        :param journal: The journal, as returned by :meth:`_open_journal`.
+        :type journal: file object
+
+        :return: Whether events may still be appended to the journal.
+        :rtype: ``bool``
+        """
+        journal_stat = fstat(journal.fileno())
         try:
-            # write byte object to file
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(byte_xml)
+            aop_id = _file_id(stat(f"{self._path_stem}.aop"))
+        except FileNotFoundError:
+            aop_id = None
+        if journal_stat.st_nlink > 0 and aop_id == self._aop_id:
+            return True
+        # a journal this instance has only just created for a protocol that is already final is not left behind. Open
+        # files cannot be removed on Windows, so it is closed first
+        if journal_stat.st_nlink > 0 and journal_stat.st_size == 0:
+            self._close_journal()
+            try:
+                remove(f"{self._path_stem}.aop.journal")
+            except FileNotFoundError:
+                pass
+        return False
+
+    def _write_pending(self, journal) -> None:
+        """
+        Appends the pending events to the journal, handing them to the operating system right away, so that they
+        survive the implementing app crashing. Must be called while holding the journal's lock.
+
+        :param journal: The journal, as returned by :meth:`_open_journal`.
+        :type journal: file object
+        """
+        if self._pending:
+            journal.write(b"".join(self._pending))
+            journal.flush()
+            self._pending.clear()
+            self._dirty = True
+
+    def _discard_pending(self) -> SessionStateError:
+        """
+        Drops the pending events of a session whose protocol has been composed by another Session handle.
+
+        :return: The error to be raised, naming the reason the events could not be logged.
+        :rtype: :class:`SessionStateError`
+        """
+        self._pending.clear()
+        self._dirty = False
+        _unflushed_sessions.discard(self)
+        self._close_journal()
+        return SessionStateError(event="log to the protocol", state="ended or aborted by another Session handle")
+
+    def _flush(self, force: bool = False) -> None:
+        """
+        Writes pending events to the journal and the .aopl, and syncs both to disk if the flush interval has passed
+        since they were last synced.
+
+        Events that are not synced right away are still guaranteed to reach the disk: the next event after the flush
+        interval, ending or aborting the session, :meth:`flush`, garbage collection and interpreter exit all sync
+        them.
+
+        :param force: Whether to sync written events to disk regardless of the flush interval, defaults to False.
+        :type force: ``bool``, optional
+
+        :raises SessionStateError: If another Session handle has ended or aborted the session in the meantime.
+        """
+        if self._aopl_fp is not None:
+            self._aopl_fp.flush()
+        if self._pending:
+            journal = self._open_journal()
+            with _locked(journal):
+                current = self._journal_is_current(journal)
+                if current:
+                    self._write_pending(journal)
+            if not current:
+                raise self._discard_pending()
+        if not self._dirty:
+            return
+        if force or monotonic() - self._last_flush >= self._flush_interval:
+            # a single fsync per batch makes the written events survive a system crash as well
+            for fp in (self._journal_fp, self._aopl_fp):
+                if fp is not None:
+                    fsync(fp.fileno())
+            self._dirty = False
+            self._last_flush = monotonic()
+            _unflushed_sessions.discard(self)
+        else:
+            _unflushed_sessions.add(self)
+
+    def flush(self) -> None:
+        """
+        Makes sure every event logged so far is synced to disk.
+
+        Events are written to the protocol's journal as soon as they are logged, but only synced to disk in batches.
+        Front-ends sharing a session may call this e.g. before handing it over to another one, or before shutting down
+        the machine.
+
+        :raises SessionStateError: If another Session handle has ended or aborted the session in the meantime.
+        """
+        self._flush(force=True)
+
+    def _flush_on_exit(self) -> None:
+        """
+        Syncs all logged events when the session is garbage-collected or the interpreter exits, where raising
+        is not an option. Events that cannot be logged any more are reported as a warning instead.
+        """
+        try:
+            self._flush(force=True)
+        except SessionStateError as error:
+            warnings.warn(f"Events of session {self.obsID} were not logged. {error}", RuntimeWarning)
+
+    def _compose_protocol(self) -> None:
+        """
+        Writes the complete .aop once the session is over, and removes the then obsolete journal.
+
+        Other Session handles, e.g. one returned by :func:`parse_session`, may have journaled events this instance
+        has never seen. The protocol is therefore composed from the .aop and journal on disk rather than from memory,
+        all while holding the journal's lock, so that nobody can append to the journal in between.
+
+        :raises PermissionError: If the user does not have the adequate access rights for writing to the .aop file.
+        :raises SessionStateError: If another Session handle has ended or aborted the session in the meantime.
+        """
+        self._load_protocol()
+        aop_path = f"{self._path_stem}.aop"
+        journal_path = f"{aop_path}.journal"
+        journal = self._open_journal()
+        try:
+            with _locked(journal):
+                current = self._journal_is_current(journal)
+                if current:
+                    self._write_pending(journal)
+                    self._dirty = False
+                    _unflushed_sessions.discard(self)
+                    with open(aop_path, "rb") as protocol:
+                        self._tree = ET.parse(protocol)
+                    self._root = self._tree.getroot()
+                    self._parameters_tag = None
+                    self._parameters_text = {}
+                    # the lock is held on the file object used for appending, so the journal is read through a second
+                    # one that is not locked itself
+                    with open(journal_path, "rb") as journal_lines:
+                        _replay_journal(self._root, journal_lines)
+                    self._write_protocol()
+                    # open files cannot be removed on Windows, so the journal is closed first. Any other handle
+                    # taking the lock in between finds the .aop replaced already and does not write to it
+                    self._close_journal()
+                    try:
+                        remove(journal_path)
+                    except FileNotFoundError:
+                        pass
+        finally:
+            self._close_journal()
+        if not current:
+            raise self._discard_pending()
+
+    def _write_protocol(self) -> None:
+        """
+        Atomically replaces the session's .aop protocol with the element tree held in memory.
+
+        :raises PermissionError: If the user does not have the adequate access rights for writing to the .aop file.
+        """
+
+        # trying to stream the xml straight into a temporary file, if we have permission to do so. Unlike
+        # ET.tostring(), this never holds the whole serialized document in memory. Only once the temporary file is
+        # safely on disk, it replaces the .aop, so a crash while writing can never leave a truncated protocol behind
+        aop_path = f"{self._path_stem}.aop"
+        try:
+            with open(f"{aop_path}.tmp", "wb") as f:
+                self._tree.write(f, encoding="UTF-8", xml_declaration=True)
+                f.flush()
+                fsync(f.fileno())
+            replace(f"{aop_path}.tmp", aop_path)
+            self._aop_id = _file_id(stat(aop_path))
         except PermissionError:
             raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-        # v2.x END
+
+    def _update_parameters(self, session_root: ET.Element):
+        """
+        Updates the parameters tag of the protocol in place, so that it holds the current observation parameters.
+
+        The tag is created on first use. Nothing is done if the parameters have not changed since the tag was last
+        updated by this instance.
+
+        :param session_root: The root element (session) of the protocol.
+        :type session_root: ``xml.etree.ElementTree.Element``
+
+        :return: The parameters element, or None if the parameters have not changed.
+        :rtype: ``xml.etree.ElementTree.Element`` or ``None``
+        """
+        # find the tag, or create it if the protocol does not have one yet
+        if self._parameters_tag is None:
+            self._parameters_tag = session_root.find("parameters")
+            if self._parameters_tag is None:
+                self._parameters_tag = ET.SubElement(session_root, "parameters")
+
+        # only the text of parameters that changed is replaced. A sub-tag is created the first time a parameter is
+        # logged
+        changed = False
+        for i, value in self._observation_parameters().items():
+            text = str(value)
+            if self._parameters_text.get(i) == text:
+                continue
+            self._parameters_text[i] = text
+            current_parameter = self._parameters_tag.find(i)
+            if current_parameter is None:
+                current_parameter = ET.SubElement(self._parameters_tag, i)
+            current_parameter.text = text
+            changed = True
+        return self._parameters_tag if changed else None
+
+    def _require_running(self, event: str) -> None:
+        """
+        Makes sure an event can be logged, i.e. the session has been started and is currently "running".
+
+        :param event: A description of the event to be logged, used in the error messages, e.g. "take frame".
+        :type event: ``str``
+
+        :raises SessionNotStartedError: If the session has not been started yet.
+        :raises SessionStateError: If the session is not currently "running".
+        """
+        if not self.started:
+            raise SessionNotStartedError(event)
+        if self.state is not SessionState.RUNNING:
+            raise SessionStateError(event=event, state="not 'running'")
 
     @staticmethod
-    def __write_to_aop(self, opcode: str, argument: str, time: str = "current") -> None:
+    def _new_event(session_root: ET.Element, tag: str, time: str) -> ET.Element:
+        """
+        Creates a new event sub-element of the protocol's root, holding time and entry ID as items.
+
+        :param session_root: The root element (session) of the protocol.
+        :type session_root: ``xml.etree.ElementTree.Element``
+        :param tag: The tag of the event, e.g. "comment".
+        :type tag: ``str``
+        :param time: An ISO 8601 conform string of the UTC datetime of the event, or "current".
+        :type time: ``str``
+
+        :return: The new event element.
+        :rtype: ``xml.etree.ElementTree.Element``
+        """
+        event_element = ET.SubElement(session_root, tag)
+        jd, entry_id = _jd_and_entry_id(time)
+        event_element.set("time", str(jd))
+        event_element.set("id", entry_id)
+        return event_element
+
+    def _append_event(self, tag: str, time: str, text=None, children=(), parameters_changed: bool = False,
+                      session_event: bool = False) -> None:
+        """
+        Logs an event to the .aop protocol.
+
+        :param tag: The tag of the event, e.g. "comment".
+        :type tag: ``str``
+        :param time: An ISO 8601 conform string of the UTC datetime of the event, or "current".
+        :type time: ``str``
+        :param text: The text of the event tag, if any, defaults to None.
+        :type text: any, optional
+        :param children: The sub-tags to add to the event tag, in order, each given either as a (tag, text) pair or as
+            a ready-made element, defaults to ().
+        :type children: ``iterable[tuple[str, any] | xml.etree.ElementTree.Element]``, optional
+        :param parameters_changed: Whether the event changed session parameters, so that the parameters tag needs
+            to be updated as well, defaults to False.
+        :type parameters_changed: ``bool``, optional
+        :param session_event: Whether the event changes the session's state, so that it has to reach the disk right
+            away instead of with the next batch, defaults to False.
+        :type session_event: ``bool``, optional
+
+        :raises PermissionError: If the user does not have the adequate access rights for writing to the journal.
+        :raises SessionStateError: If another Session handle has ended or aborted the session in the meantime.
+        """
+        session_root = self._load_protocol()
+        event_element = self._new_event(session_root, tag, time)
+        if text is not None:
+            event_element.text = str(text)
+        # the sub-tags are built first, so they can be attached all at once
+        event_element.extend([child if ET.iselement(child) else _text_element(*child) for child in children])
+        parameters_element = self._update_parameters(session_root) if parameters_changed else None
+        if parameters_element is not None:
+            self._journal(event_element, parameters_element, force=session_event)
+        else:
+            self._journal(event_element, force=session_event)
+
+    def __write_to_aop(self, opcode: str, argument: str, time: str = "current", *values) -> None:
         """
         This pseudo-private method is called to update the .aopl legacy protocol file.
 
@@ -458,7 +1407,8 @@ class Session:
             described in the AOP Syntax Guide.
         :type opcode: ``str``
         :param argument: Whatever is to be written to the argument position in the .aopl
-            protocol entry.
+            protocol entry. If ``values`` are given, this is a %-style template they are
+            substituted into, which only happens if the .aopl is actually written.
         :type argument: ``str``
         :param time: An ISO 8601 conform string of the UTC datetime you want to use. Can also be "current", in which
             case the current UTC datetime will be used.
@@ -469,15 +1419,25 @@ class Session:
         :raises PermissionError: If the user does not have the adequate access rights for writing to the .aopl file.
         """
 
-        # try to open the existing
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aopl", "at") as f:
-                f.write(f"({create_entry_id(time)}) {current_jd(time):.10f} -> {opcode} "
-                        f"{argument}\n")
-        except PermissionError:
-            raise PermissionError("Error when writing to .aopl: You do not have the adequate access rights!")
+        if not self.WRITE_LEGACY_FILES:
+            return
+
+        # sessions restored by parse_session() have not opened the existing protocol yet
+        if self._aopl_fp is None:
+            try:
+                self._aopl_fp = open(f"{self._path_stem}.aopl", "ab", buffering=65536)
+            except PermissionError:
+                raise PermissionError("Error when writing to .aopl: You do not have the adequate access rights!")
+
+        if values:
+            argument = argument % values
+        jd, entry_id = _jd_and_entry_id(time)
+        self._aopl_fp.write(f"({entry_id}) {jd:.10f} -> {opcode} {argument}\n".encode("utf-8"))
+        # entries are written right away, but synced to disk in batches along with the journal. Session events (start,
+        # interrupt, resume, abort, end) are synced right away, so that the legacy protocol survives a system crash
+        self._dirty = True
+        self._flush(force=opcode == "SEEV")
 
-    @staticmethod
     def __write_to_aol(self, parameter: str, assigned_value) -> None:
         """
         This pseudo-private method is used to update the .aol legacy parameter log.
@@ -492,23 +1452,23 @@ class Session:
             is a string or boolean.
         :type assigned_value: any
 
-        :raises PermissionError: If the user does not have the adequate access rights for reading from the .aol file.
         :raises PermissionError: If the user does not have the adequate access rights for writing to the .aol file.
         """
 
-        # write flag change to parameter log. Since this is JSON, the file
-        # is first read to param ...
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aol", "rb") as log:
-                param = json.load(log)
-        except PermissionError:
-            raise PermissionError("Error when reading from .aol: You do not have the adequate access rights!")
+        if not self.WRITE_LEGACY_FILES:
+            return
+
+        # write flag change to parameter log. The session's attributes hold every logged parameter, so rather than
+        # reading the file back first, param is assembled from them ...
+        param = self._observation_parameters()
+        # states are logged by name rather than by their integer value
+        param["state"] = str(param["state"])
         # ... then the flag is updated there ...
         param[parameter] = assigned_value
         # ... before the file is overwritten with the updated param object.
         try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aol", "w") as log:
-                log.write(json.dumps(param, indent=4))
+            with open(f"{self._path_stem}.aol", "wb") as log:
+                log.write(_dumps_parameter_log(param))
         except PermissionError:
             raise PermissionError("Error when writing to .aol: You do not have the adequate access rights!")
 
@@ -531,7 +1491,7 @@ class Session:
         # make sure interrupting makes sense
         if not self.started:
             raise SessionNotStartedError("interrupt session")
-        if not self.state == "running":
+        if self.state is not SessionState.RUNNING:
             raise NotInterruptableError
         if self.interrupted:
             raise AlreadyInterruptedError
@@ -542,55 +1502,17 @@ class Session:
 
         # v1.x START
         # write session event: session interrupted to protocol
-        self.__write_to_aop(self, "SEEV", "SESSION INTERRUPTED", time=time)
+        self.__write_to_aop("SEEV", "SESSION INTERRUPTED", time=time)
 
         # update session parameters: interrupted = True
         assigned_value = True
-        self.__write_to_aol(self, "interrupted", assigned_value)
+        self.__write_to_aol("interrupted", assigned_value)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "interrupt" sub-element of root
-        interrupt_element = ET.SubElement(session_root, "interrupt")
-
-        # add time and entry ID as items of the interrupt tag
-        interrupt_element.set("time", str(current_jd(time)))
-        interrupt_element.set("id", str(create_entry_id()))
-
-        # since session parameters have changed (interrupted is now True), we need to replace the
-        # parameters tag as well
-
-        # firstly remove the old tag...
-        for parameter_tag in session_root.findall("parameters"):
-            session_root.remove(parameter_tag)
-
-        # ...then re-create it with the updated parameters
-        parameters_tag = ET.SubElement(session_root, "parameters")
-
-        # populate the parameters sub-element with all the available metadata
-        for i in self.__dict__:
-            # the self.parameters attribute is legacy only and should be treated as such when updating the code
-            if i != "parameters":
-                current_parameter = ET.SubElement(parameters_tag, i)
-                current_parameter.text = str(self.__dict__[i])
-
-        # finally, we overwrite the .aop with the updated element tree
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "interrupt" sub-element to the protocol's root. Since session parameters have changed
+        # (interrupted is now True), the parameters tag is updated as well
+        self._append_event("interrupt", time, parameters_changed=True, session_event=True)
         # v2.x END
 
     def resume(self, time: str = "current") -> None:
@@ -612,7 +1534,7 @@ class Session:
         # make sure resuming makes sense
         if not self.started:
             raise SessionNotStartedError("resume session")
-        if not self.state == "running":
+        if self.state is not SessionState.RUNNING:
             raise NotResumableError
         if not self.interrupted:
             raise NotInterruptedError
@@ -623,55 +1545,17 @@ class Session:
 
         # v1.x START
         # write session event: session resumed to protocol
-        self.__write_to_aop(self, "SEEV", "SESSION RESUMED", time)
+        self.__write_to_aop("SEEV", "SESSION RESUMED", time)
 
         # update session parameters: interrupted = False
         assigned_value = False
-        self.__write_to_aol(self, "interrupted", assigned_value)
+        self.__write_to_aol("interrupted", assigned_value)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "resume" sub-element of root
-        resume_element = ET.SubElement(session_root, "resume")
-
-        # add time and entry ID as items of the resume tag
-        resume_element.set("time", str(current_jd(time)))
-        resume_element.set("id", str(create_entry_id()))
-
-        # since session parameters have changed (interrupted is now False again), we need to replace the
-        # parameters tag as well
-
-        # firstly remove the old tag...
-        for parameter_tag in session_root.findall("parameters"):
-            session_root.remove(parameter_tag)
-
-        # ...then re-create it with the updated parameters
-        parameters_tag = ET.SubElement(session_root, "parameters")
-
-        # populate the parameters sub-element with all the available metadata
-        for i in self.__dict__:
-            # the self.parameters attribute is legacy only and should be treated as such when updating the code
-            if i != "parameters":
-                current_parameter = ET.SubElement(parameters_tag, i)
-                current_parameter.text = str(self.__dict__[i])
-
-        # finally, we overwrite the .aop with the updated element tree
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "resume" sub-element to the protocol's root. Since session parameters have changed
+        # (interrupted is now False again), the parameters tag is updated as well
+        self._append_event("resume", time, parameters_changed=True, session_event=True)
         # v2.x END
 
     def abort(self, reason: str, time: str = "current") -> None:
@@ -694,68 +1578,33 @@ class Session:
         # make sure aborting makes sense
         if not self.started:
             raise SessionNotStartedError("abort session")
-        if not self.state == "running":
+        if self.state is not SessionState.RUNNING:
             raise NotAbortableError
 
         # set state flag to "aborted"
-        self.state = "aborted"
+        self.state = SessionState.ABORTED
         # self.parameters["state"] = "aborted"
 
         # v1.x START
         # write session event: session aborted to protocol, including the
         # reason
-        self.__write_to_aop(self, "SEEV", f"{reason}: SESSION {self.obsID} ABORTED", time)
+        try:
+            self.__write_to_aop("SEEV", "%s: SESSION %s ABORTED", time, reason, self.obsID)
+        finally:
+            # no further entries can follow, so the .aopl is released
+            self._close_aopl()
 
         # update session parameters: state = aborted
-        assigned_value = "aborted"
-        self.__write_to_aol(self, "state", assigned_value)
+        assigned_value = str(SessionState.ABORTED)
+        self.__write_to_aol("state", assigned_value)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "abort" sub-element of root
-        abort_element = ET.SubElement(session_root, "abort")
-
-        # add time and entry ID as items of the abort tag
-        abort_element.set("time", str(current_jd(time)))
-        abort_element.set("id", str(create_entry_id()))
-
-        # add the reason for aborting as text of the "abort" tag
-        abort_element.text = str(reason)
-
-        # since session parameters have changed (state is now aborted), we need to replace the
-        # parameters tag as well
-
-        # firstly remove the old tag...
-        for parameter_tag in session_root.findall("parameters"):
-            session_root.remove(parameter_tag)
-
-        # ...then re-create it with the updated parameters
-        parameters_tag = ET.SubElement(session_root, "parameters")
-
-        # populate the parameters sub-element with all the available metadata
-        for i in self.__dict__:
-            # the self.parameters attribute is legacy only and should be treated as such when updating the code
-            if i != "parameters":
-                current_parameter = ET.SubElement(parameters_tag, i)
-                current_parameter.text = str(self.__dict__[i])
-
-        # finally, we overwrite the .aop with the updated element tree
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "abort" sub-element to the protocol's root, holding the reason for aborting as text.
+        # Since session parameters have changed (state is now aborted), the parameters tag is updated as well
+        self._append_event("abort", time, text=reason, parameters_changed=True, session_event=True)
+        # the session is over, so the final .aop is composed from the journal
+        self._compose_protocol()
         # v2.x END
 
     def end(self, time: str = "current") -> None:
@@ -776,64 +1625,32 @@ class Session:
         # make sure ending makes sense
         if not self.started:
             raise SessionNotStartedError("end session")
-        if not self.state == "running":
+        if self.state is not SessionState.RUNNING:
             raise NotEndableError
 
         # set state flag to "ended"
-        self.state = "ended"
+        self.state = SessionState.ENDED
         # self.parameters["state"] = "ended"
 
         # v1.x START
         # write session event: session ended to protocol
-        self.__write_to_aop(self, "SEEV", f"SESSION {self.obsID} ENDED", time)
+        try:
+            self.__write_to_aop("SEEV", "SESSION %s ENDED", time, self.obsID)
+        finally:
+            # no further entries can follow, so the .aopl is released
+            self._close_aopl()
 
         # update session parameters: state = ended
-        assigned_value = "ended"
-        self.__write_to_aol(self, "state", assigned_value)
+        assigned_value = str(SessionState.ENDED)
+        self.__write_to_aol("state", assigned_value)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "end" sub-element of root
-        end_element = ET.SubElement(session_root, "end")
-
-        # add time and entry ID as items of the end tag
-        end_element.set("time", str(current_jd(time)))
-        end_element.set("id", str(create_entry_id()))
-
-        # since session parameters have changed (state is now ended), we need to replace the
-        # parameters tag as well
-
-        # firstly remove the old tag...
-        for parameter_tag in session_root.findall("parameters"):
-            session_root.remove(parameter_tag)
-
-        # ...then re-create it with the updated parameters
-        parameters_tag = ET.SubElement(session_root, "parameters")
-
-        # populate the parameters sub-element with all the available metadata
-        for i in self.__dict__:
-            # the self.parameters attribute is legacy only and should be treated as such when updating the code
-            if i != "parameters":
-                current_parameter = ET.SubElement(parameters_tag, i)
-                current_parameter.text = str(self.__dict__[i])
-
-        # finally, we overwrite the .aop with the updated element tree
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "end" sub-element to the protocol's root. Since session parameters have changed
+        # (state is now ended), the parameters tag is updated as well
+        self._append_event("end", time, parameters_changed=True, session_event=True)
+        # the session is over, so the final .aop is composed from the journal
+        self._compose_protocol()
         # v2.x END
 
     def comment(self, comment: str, time: str = "current") -> None:
@@ -852,41 +1669,15 @@ class Session:
         """
 
         # make sure commenting makes sense
-        if not self.started:
-            raise SessionNotStartedError("add comment")
-        if not self.state == "running":
-            raise SessionStateError(event="add comment", state="not 'running'")
+        self._require_running("add comment")
 
         # v1.x START
-        self.__write_to_aop(self, "OBSC", comment, time)
+        self.__write_to_aop("OBSC", comment, time)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "comment" sub-element of root
-        comment_element = ET.SubElement(session_root, "comment")
-
-        # add time and entry ID as items of the comment tag
-        comment_element.set("time", str(current_jd(time)))
-        comment_element.set("id", str(create_entry_id()))
-
-        # add the actual comment as text to the comment tag
-        comment_element.text = str(comment)
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "comment" sub-element to the protocol's root, holding the actual comment as text
+        self._append_event("comment", time, text=comment)
         # v2.x END
 
     def issue(self, severity: str, message: str, time: str = "current") -> None:
@@ -927,59 +1718,23 @@ class Session:
         """
 
         # make sure reporting an issue makes sense
-        if not self.started:
-            raise SessionNotStartedError("report issue")
-        if not self.state == "running":
-            raise SessionStateError(event="report issue", state="not 'running'")
+        self._require_running("report issue")
 
-        # v1.x START
-        if severity == "potential" or severity == "p":
-            self.__write_to_aop(self, "ISSU", f"Potential Issue: {message}", time)
-        elif severity == "normal" or severity == "n":
-            self.__write_to_aop(self, "ISSU", f"Normal Issue: {message}", time)
-        elif severity == "major" or severity == "m":
-            self.__write_to_aop(self, "ISSU", f"Major Issue: {message}", time)
-        else:
-            # the above three cases are the only ones recognized by aop.
-            # if users provide any other issue severity values, aop raises an error.
+        # make sure we're reporting a valid issue severity. The three severities in _ISSUE_SEVERITIES are the
+        # only ones recognized by aop. If users provide any other issue severity values, aop raises an error.
+        severity = _ISSUE_SEVERITIES.get(severity)
+        if severity is None:
             raise ValueError("Invalid issue severity!")
+
+        # v1.x START
+        self.__write_to_aop("ISSU", "%s Issue: %s", time, severity.title(), message)
         # v1.x END
 
         # v2.x START
-        # make sure we're reporting a valid issue severity
-        if severity in ["potential", "p", "normal", "n", "major", "m"]:
-            # parse element tree from .aop
-            tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-            # get root tag (session)
-            session_root = tree.getroot()
-
-            # create a new "issue" sub-element of root
-            issue_element = ET.SubElement(session_root, "issue")
-
-            # add time and entry ID as items of the issue tag
-            issue_element.set("time", str(current_jd(time)))
-            issue_element.set("id", str(create_entry_id()))
-
-            # add the issue severity and the issue description as sub-tags of the issue tag
-            severity_tag = ET.SubElement(issue_element, "severity")
-            severity_tag.text = severity
-
-            description_tag = ET.SubElement(issue_element, "description")
-            description_tag.text = str(message)
-
-            # converting xml to a byte object...
-            session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-            # ...then trying to write the file to memory, if we have permission to do so
-            try:
-                with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                    f.write(session_byte)
-            except PermissionError:
-                raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-            # v2.x END
-        else:
-            raise ValueError("Invalid issue severity!")
+        # add a new "issue" sub-element to the protocol's root, holding the issue severity and the issue
+        # description as sub-tags
+        self._append_event("issue", time, children=(("severity", severity), ("description", message)))
+        # v2.x END
 
     def point_to_name(self, targets: list, time: str = "current") -> None:
         """
@@ -1002,10 +1757,7 @@ class Session:
         """
 
         # make sure pointing to name makes sense
-        if not self.started:
-            raise SessionNotStartedError("point to name")
-        if not self.state == "running":
-            raise SessionStateError(event="point to name", state="not 'running'")
+        self._require_running("point to name")
 
         # v1.x START
         # unfortunately now you have to provide a list for targets, but this
@@ -1015,15 +1767,10 @@ class Session:
             # the *args syntax can't be used here, so you have to provide a
             # list, ...
             raise TypeError("Please provide the 'targets' argument as a list, even if it only has one item.")
-        tar_str = ""
-        # ... which is then iterated through by the function ...
-        for i in range(len(targets)):
-            # ... that finally constructs a comma-separated string from the list ...
-            if not i == 0:
-                tar_str += ", "
-            tar_str += targets[i]
-        # ... and writes that string to the protocol.
-        self.__write_to_aop(self, "POIN", f"Pointing at target(s): {tar_str}", time)
+        # ... which is then joined into a comma-separated string that is written to the protocol. Joining only pays off
+        # if the legacy protocol is actually written
+        if self.WRITE_LEGACY_FILES:
+            self.__write_to_aop("POIN", "Pointing at target(s): %s", time, ", ".join(map(str, targets)))
         # v1.x END
 
         # v2.x START
@@ -1031,33 +1778,8 @@ class Session:
         if not isinstance(targets, list):
             raise TypeError("Please provide the 'targets' argument as a list, even if it only has one item.")
 
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "point" sub-element of root
-        point_element = ET.SubElement(session_root, "point")
-
-        # add time and entry ID as items of the point tag
-        point_element.set("time", str(current_jd(time)))
-        point_element.set("id", str(create_entry_id()))
-
-        # add the contents of the targets list as sub-tags to the point tag
-        for i in targets:
-            new_target_element = ET.SubElement(point_element, "name")
-            new_target_element.text = str(i)
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "point" sub-element to the protocol's root, holding the contents of the targets list as sub-tags
+        self._append_event("point", time, children=[("name", i) for i in targets])
         # v2.x END
 
     def point_to_coords(self, ra: float, dec: float, time: str = "current") -> None:
@@ -1086,62 +1808,37 @@ class Session:
         """
 
         # make sure pointing to coords makes sense
-        if not self.started:
-            raise SessionNotStartedError("point to coords")
-        if not self.state == "running":
-            raise SessionStateError(event="point to coords", state="not 'running'")
+        self._require_running("point to coords")
 
         # exclude invalid coord values
-        if not type(ra) == float:
-            raise TypeError(f"Please put in coordinates as 'float' object! R.A. value of {str(ra)} is not 'float'.")
-        if not type(dec) == float:
-            raise TypeError(f"Please put in coordinates as 'float' object! Dec. value of {str(dec)} is not 'float'.")
-        if ra < 0.0:
-            raise ValueError(f"R.A. value of {str(ra)} is out of range! Must be >= 0.0h.")
-        elif ra >= 24.0:
-            raise ValueError(f"R.A. value of {str(ra)} is out of range! Must be < 24.0h. aop expects an R.A. value in "
-                             f"hours, so if your coordinates are in degrees, please convert to hours beforehand (divide"
-                             f" by 15).")
-        if dec < -90.0:
-            raise ValueError(f"Dec. value of {str(dec)} is out of range! Must be >= -90.0°.")
-        elif dec > 90.0:
-            raise ValueError(f"Dec. value of {str(dec)} is out of range! Must be <= 90.0°.")
+        for value, coordinate in ((ra, "R.A."), (dec, "Dec.")):
+            if not isinstance(value, float):
+                raise TypeError(f"Please put in coordinates as 'float' object! {coordinate} value of {str(value)} is "
+                                f"not 'float'.")
+        # valid coordinates only need a single chained comparison each. Which bound was violated is only looked
+        # into once a value is out of range
+        if not 0.0 <= ra < 24.0:
+            if ra < 0.0:
+                raise ValueError(f"R.A. value of {str(ra)} is out of range! Must be >= 0.0h.")
+            elif ra >= 24.0:
+                raise ValueError(f"R.A. value of {str(ra)} is out of range! Must be < 24.0h. aop expects an R.A. value "
+                                 f"in hours, so if your coordinates are in degrees, please convert to hours beforehand "
+                                 f"(divide by 15).")
+        if not -90.0 <= dec <= 90.0:
+            if dec < -90.0:
+                raise ValueError(f"Dec. value of {str(dec)} is out of range! Must be >= -90.0°.")
+            elif dec > 90.0:
+                raise ValueError(f"Dec. value of {str(dec)} is out of range! Must be <= 90.0°.")
 
         # if the values are valid, we can write them to the protocol
         # v1.x START
-        self.__write_to_aop(self, "POIN", f"Pointing at coordinates: R.A.: {ra} Dec.: {dec}", time)
+        self.__write_to_aop("POIN", "Pointing at coordinates: R.A.: %s Dec.: %s", time, ra, dec)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "point" sub-element of root
-        point_element = ET.SubElement(session_root, "point")
-
-        # add time and entry ID as items of the point tag
-        point_element.set("time", str(current_jd(time)))
-        point_element.set("id", str(create_entry_id()))
-
-        # add R.A. and Dec. of the target as sub-tags to the point tag respectively
-        ra_sub_tag = ET.SubElement(point_element, "ra")
-        ra_sub_tag.text = str(ra)
-
-        dec_sub_tag = ET.SubElement(point_element, "dec")
-        dec_sub_tag.text = str(dec)
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "point" sub-element to the protocol's root, holding R.A. and Dec. of the target as sub-tags
+        # respectively
+        self._append_event("point", time, children=(("ra", ra), ("dec", dec)))
         # v2.x END
 
     def take_frame(self, n: int, ftype: str, iso: int, expt: float, ap: float, time: str = "current") -> None:
@@ -1231,84 +1928,30 @@ class Session:
         """
 
         # make sure frame taking makes sense
-        if not self.started:
-            raise SessionNotStartedError("take frame")
-        if not self.state == "running":
-            raise SessionStateError(event="take frame", state="not 'running'")
+        self._require_running("take frame")
 
         # type check
-        if not type(n) == int:
-            raise TypeError("Please provide an integer as frame number ('n' argument)!")
-        if not type(ftype) == str:
-            raise TypeError("Please provide a string as frame type ('ftype' argument)!")
-        if not type(expt) == float:
-            raise TypeError("Please provide a float as exposure time ('expt' argument)!")
-        if not type(ap) == float:
-            raise TypeError("Please provide a float as aperture ('ap' argument)!")
-        if not type(iso) == int:
-            raise TypeError("Please provide an integer as ISO value ('iso' argument)!")
+        for value, (argument, required_type, description) in zip((n, ftype, expt, ap, iso), _FRAME_ARGUMENT_TYPES):
+            if not isinstance(value, required_type):
+                raise TypeError(f"Please provide {description} ('{argument}' argument)!")
 
         # decode or pass ftype - or raise ValueError if invalid key
-        if ftype == "science" or ftype == "science frame" or ftype == "s" or ftype == "sc":
-            typestr = "science"
-        elif ftype == "dark" or ftype == "dark frame" or ftype == "d" or ftype == "df":
-            typestr = "dark"
-        elif ftype == "flat" or ftype == "flat frame" or ftype == "f" or ftype == "ff":
-            typestr = "flat"
-        elif ftype == "bias" or ftype == "bias frame" or ftype == "b" or ftype == "bf":
-            typestr = "bias"
-        elif ftype == "pointing" or ftype == "pointing frame" or ftype == "p" or ftype == "pf":
-            typestr = "pointing"
-        else:
+        typestr = _FRAME_TYPES.get(ftype)
+        if typestr is None:
             raise ValueError("Invalid frame type!")
 
         # after decoding the type of the frame, all the data is written to the
         # protocol
         # v1.x START
-        self.__write_to_aop(self, "FRAM",
-                            f"{n} {typestr} frame(s) taken with settings: Exp.t.: {expt}s, Ap.: f/{ap}, ISO: {iso}",
-                            time)
+        self.__write_to_aop("FRAM", "%s %s frame(s) taken with settings: Exp.t.: %ss, Ap.: f/%s, ISO: %s", time,
+                            n, typestr, expt, ap, iso)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-        # get root tag (session)
-        session_root = tree.getroot()
-
-        # create a new "frame" sub-element of root
-        frame_element = ET.SubElement(session_root, "frame")
-
-        # add time and entry ID as items of the frame tag
-        frame_element.set("time", str(current_jd(time)))
-        frame_element.set("id", str(create_entry_id()))
-
-        # add the camera settings as sub-tags of the frame tag, respectively
-        number_tag = ET.SubElement(frame_element, "number_of_frames")
-        number_tag.text = str(n)
-
-        ftype_tag = ET.SubElement(frame_element, "type")
-        ftype_tag.text = typestr
-
-        expt_tag = ET.SubElement(frame_element, "exposure")
-        expt_tag.text = str(expt)
-
-        iso_tag = ET.SubElement(frame_element, "iso")
-        iso_tag.text = str(iso)
-
-        ap_tag = ET.SubElement(frame_element, "aperture")
-        ap_tag.text = str(ap)
-
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-        # ...then trying to write the file to memory, if we have permission to do so
-        try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
+        # add a new "frame" sub-element to the protocol's root, holding the camera settings as sub-tags,
+        # respectively
+        self._append_event("frame", time, children=(("number_of_frames", n), ("type", typestr), ("exposure", expt),
+                                                     ("iso", iso), ("aperture", ap)))
         # v2.x END
 
     def condition_report(self, description: str = None, temp: float = None, pressure: float = None, humidity: float =
@@ -1346,251 +1989,54 @@ class Session:
         """
 
         # make sure reporting conditions makes sense
-        if not self.started:
-            raise SessionNotStartedError("report observing conditions")
-        if not self.state == "running":
-            raise SessionStateError(event="report observing conditions", state="not 'running'")
-
-        if type(description) == str:
-            # if a description is provided, set the conditionDescription
-            # parameter
-            self.conditionDescription = description
-            # self.parameters["conditionDescription"] = self.conditionDescription
-
-            # v1.x START
-            # update session parameters: conditionDescription = description
-            self.__write_to_aol(self, "conditionDescription", description)
-
-            # finally, write condition description to protocol
-            self.__write_to_aop(self, "CDES", description, time)
-            # v1.x END
-
-            # v2.x START
-            # parse element tree from .aop
-            tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-            # get root tag (session)
-            session_root = tree.getroot()
-
-            # create a new "condition_description" sub-element of root
-            condition_description_element = ET.SubElement(session_root, "condition_description")
+        self._require_running("report observing conditions")
 
-            # add time and entry ID as items of the condition_description tag
-            condition_description_element.set("time", str(current_jd(time)))
-            condition_description_element.set("id", str(create_entry_id()))
+        if isinstance(description, str):
+            # if a description is provided, set and log the conditionDescription parameter
+            self._report_condition("conditionDescription", "condition_description", description, "CDES", "%s", time)
 
-            # add the actual condition description as text of the condition description tag
-            condition_description_element.text = str(description)
+        if isinstance(temp, _NUMERIC):
+            # if a temperature is provided, set and log the temp parameter
+            self._report_condition("temp", "temperature", temp, "CMES", "Temperature: %s°C", time)
 
-            # since session parameters have changed (conditionDescription), we need to replace the
-            # parameters tag as well
-
-            # firstly remove the old tag...
-            for parameter_tag in session_root.findall("parameters"):
-                session_root.remove(parameter_tag)
-
-            # ...then re-create it with the updated parameters
-            parameters_tag = ET.SubElement(session_root, "parameters")
-
-            # populate the parameters sub-element with all the available metadata
-            for i in self.__dict__:
-                # the self.parameters attribute is legacy only and should be treated as such when updating the code
-                if i != "parameters":
-                    current_parameter = ET.SubElement(parameters_tag, i)
-                    current_parameter.text = str(self.__dict__[i])
-
-            # finally, we overwrite the .aop with the updated element tree
-
-            # converting xml to a byte object...
-            session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-            # ...then trying to write the file to memory, if we have permission to do so
-            try:
-                with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                    f.write(session_byte)
-            except PermissionError:
-                raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-            # v2.x END
+        if isinstance(pressure, _NUMERIC):
+            # if a pressure is provided, set and log the pressure parameter
+            self._report_condition("pressure", "pressure", pressure, "CMES", "Air Pressure: %s hPa", time)
 
-        if type(temp) == float or type(temp) == int:
-            # if a temperature is provided, set the temp parameter
-            self.temp = temp
-            # self.parameters["temp"] = self.temp
+        if isinstance(humidity, _NUMERIC):
+            # if a humidity value is provided, set and log the humidity parameter
+            self._report_condition("humidity", "humidity", humidity, "CMES", "Air Humidity: %s%%", time)
 
-            # v1.x START
-            # update session parameters: temp = temp
-            self.__write_to_aol(self, "temp", temp)
-
-            # finally, write temperature measurement to protocol
-            self.__write_to_aop(self, "CMES", f"Temperature: {self.temp}°C", time)
-            # v1.x END
-
-            # v2.x START
-            # parse element tree from .aop
-            tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-            # get root tag (session)
-            session_root = tree.getroot()
-
-            # create a new "temperature" sub-element of root
-            temperature_element = ET.SubElement(session_root, "temperature")
-
-            # add time and entry ID as items of the temperature tag
-            temperature_element.set("time", str(current_jd(time)))
-            temperature_element.set("id", str(create_entry_id()))
-
-            # add the actual temperature as text of the temperature tag
-            temperature_element.text = str(temp)
-
-            # since session parameters have changed (temp), we need to replace the
-            # parameters tag as well
-
-            # firstly remove the old tag...
-            for parameter_tag in session_root.findall("parameters"):
-                session_root.remove(parameter_tag)
-
-            # ...then re-create it with the updated parameters
-            parameters_tag = ET.SubElement(session_root, "parameters")
-
-            # populate the parameters sub-element with all the available metadata
-            for i in self.__dict__:
-                # the self.parameters attribute is legacy only and should be treated as such when updating the code
-                if i != "parameters":
-                    current_parameter = ET.SubElement(parameters_tag, i)
-                    current_parameter.text = str(self.__dict__[i])
-
-            # finally, we overwrite the .aop with the updated element tree
-
-            # converting xml to a byte object...
-            session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-            # ...then trying to write the file to memory, if we have permission to do so
-            try:
-                with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                    f.write(session_byte)
-            except PermissionError:
-                raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-            # v2.x END
-
-        if type(pressure) == int or type(pressure) == float:
-            # if a pressure is provided, set the pressure parameter
-            self.pressure = pressure
-            # self.parameters["pressure"] = self.pressure
-
-            # v1.x START
-            # update session parameters: pressure = pressure
-            self.__write_to_aol(self, "pressure", pressure)
-
-            # finally, write pressure measurement to protocol
-            self.__write_to_aop(self, "CMES", f"Air Pressure: {self.pressure} hPa", time)
-            # v1.x END
-
-            # v2.x START
-            # parse element tree from .aop
-            tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-            # get root tag (session)
-            session_root = tree.getroot()
-
-            # create a new "pressure" sub-element of root
-            pressure_element = ET.SubElement(session_root, "pressure")
-
-            # add time and entry ID as items of the point tag
-            pressure_element.set("time", str(current_jd(time)))
-            pressure_element.set("id", str(create_entry_id()))
-
-            # add the actual pressure as text of the pressure tag
-            pressure_element.text = str(pressure)
-
-            # since session parameters have changed (pressure), we need to replace the
-            # parameters tag as well
-
-            # firstly remove the old tag...
-            for parameter_tag in session_root.findall("parameters"):
-                session_root.remove(parameter_tag)
-
-            # ...then re-create it with the updated parameters
-            parameters_tag = ET.SubElement(session_root, "parameters")
-
-            # populate the parameters sub-element with all the available metadata
-            for i in self.__dict__:
-                # the self.parameters attribute is legacy only and should be treated as such when updating the code
-                if i != "parameters":
-                    current_parameter = ET.SubElement(parameters_tag, i)
-                    current_parameter.text = str(self.__dict__[i])
-
-            # finally, we overwrite the .aop with the updated element tree
-
-            # converting xml to a byte object...
-            session_byte = ET.tostring(session_root, encoding="UTF-8")
-
-            # ...then trying to write the file to memory, if we have permission to do so
-            try:
-                with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                    f.write(session_byte)
-            except PermissionError:
-                raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-            # v2.x END
-
-        if type(humidity) == int or type(humidity) == float:
-            # if a humidity value  is provided, set the humidity parameter
-            self.humidity = humidity
-            # self.parameters["humidity"] = self.humidity
-
-            # v1.x START
-            # update session parameters: humidity = humidity
-            self.__write_to_aol(self, "humidity", humidity)
-
-            # finally, write humidity measurement to protocol
-            self.__write_to_aop(self, "CMES", f"Air Humidity: {self.humidity}%", time)
-            # v1.x END
-
-            # v2.x START
-            # parse element tree from .aop
-            tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
-
-            # get root tag (session)
-            session_root = tree.getroot()
-
-            # create a new "humidity" sub-element of root
-            humidity_element = ET.SubElement(session_root, "humidity")
-
-            # add time and entry ID as items of the humidity tag
-            humidity_element.set("time", str(current_jd(time)))
-            humidity_element.set("id", str(create_entry_id()))
-
-            # add the actual humidity as text of the humidity tag
-            humidity_element.text = str(humidity)
-
-            # since session parameters have changed (humidity), we need to replace the
-            # parameters tag as well
-
-            # firstly remove the old tag...
-            for parameter_tag in session_root.findall("parameters"):
-                session_root.remove(parameter_tag)
-
-            # ...then re-create it with the updated parameters
-            parameters_tag = ET.SubElement(session_root, "parameters")
-
-            # populate the parameters sub-element with all the available metadata
-            for i in self.__dict__:
-                # the self.parameters attribute is legacy only and should be treated as such when updating the code
-                if i != "parameters":
-                    current_parameter = ET.SubElement(parameters_tag, i)
-                    current_parameter.text = str(self.__dict__[i])
+    def _report_condition(self, parameter: str, tag: str, value, opcode: str, argument: str, time: str) -> None:
+        """
+        Sets a condition parameter and logs the report to every protocol.
 
-            # finally, we overwrite the .aop with the updated element tree
+        :param parameter: The name of the Session attribute holding the condition, e.g. "temp".
+        :type parameter: ``str``
+        :param tag: The tag of the .aop event, e.g. "temperature".
+        :type tag: ``str``
+        :param value: The reported condition description or measurement.
+        :type value: ``str``, ``float`` or ``int``
+        :param opcode: The operation code of the .aopl entry, "CDES" or "CMES".
+        :type opcode: ``str``
+        :param argument: The %-style template of the .aopl entry's argument, ``value`` is substituted into it.
+        :type argument: ``str``
+        :param time: An ISO 8601 conform string of the UTC datetime of the report, or "current".
+        :type time: ``str``
+        """
+        setattr(self, parameter, value)
 
-            # converting xml to a byte object...
-            session_byte = ET.tostring(session_root, encoding="UTF-8")
+        # v1.x START
+        # update session parameters, then write the condition report to protocol
+        self.__write_to_aol(parameter, value)
+        self.__write_to_aop(opcode, argument, time, value)
+        # v1.x END
 
-            # ...then trying to write the file to memory, if we have permission to do so
-            try:
-                with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                    f.write(session_byte)
-            except PermissionError:
-                raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-            # v2.x END
+        # v2.x START
+        # add a new sub-element to the protocol's root, holding the actual description or measurement as text.
+        # Since session parameters have changed, the parameters tag is updated as well
+        self._append_event(tag, time, text=value, parameters_changed=True)
+        # v2.x END
 
     def report_variable_star_observation(self, star_id: str, chart_id: str, magnitude: float, comparison_star_1: str,
                                          comparison_star_2: str = None, codes: list = None,
@@ -1634,68 +2080,170 @@ class Session:
             codes = []
 
         # make sure action makes sense
-        if not self.started:
-            raise SessionNotStartedError("report variable star observation")
-        if not self.state == "running":
-            raise SessionStateError(event="report variable star observation", state="not 'running'")
+        self._require_running("report variable star observation")
 
         # v1.x START
         if comparison_star_2 is not None:
-            self.__write_to_aop(self, "VSOB",
-                                f"{star_id}@{magnitude}: compared to {comparison_star_1} and "
-                                f"{comparison_star_2} on chart '{chart_id}'. Comment codes: {codes}",
-                                time)
+            self.__write_to_aop("VSOB", "%s@%s: compared to %s and %s on chart '%s'. Comment codes: %s", time,
+                                star_id, magnitude, comparison_star_1, comparison_star_2, chart_id, codes)
         else:
-            self.__write_to_aop(self, "VSOB",
-                                f"{star_id}@{magnitude}: compared to {comparison_star_1} on chart '{chart_id}'."
-                                f" Comment codes: {codes}",
-                                time)
+            self.__write_to_aop("VSOB", "%s@%s: compared to %s on chart '%s'. Comment codes: %s", time,
+                                star_id, magnitude, comparison_star_1, chart_id, codes)
         # v1.x END
 
         # v2.x START
-        # parse element tree from .aop
-        tree = ET.parse(f"{self.filepath}/{self.obsID}/{self.obsID}.aop")
+        # add the star-specific observation parameters as sub-tags of the variable_star tag, respectively
+        children = [("star_id", star_id), ("magnitude", magnitude), ("chart_id", chart_id),
+                    ("comparison_star_1", comparison_star_1)]
+        if comparison_star_2 is not None:
+            children.append(("comparison_star_2", comparison_star_2))
 
-        # get root tag (session)
-        session_root = tree.getroot()
+        # every comment code gets a sub-tag of its own, so the list can be read back without evaluating its repr
+        codes_element = ET.Element("observation_codes")
+        codes_element.extend([_text_element("code", code) for code in codes])
+        children.append(codes_element)
 
-        # create a new "variable_star" sub-element of root
-        variable_star_element = ET.SubElement(session_root, "variable_star_observation")
+        # add a new "variable_star_observation" sub-element to the protocol's root, holding them
+        self._append_event("variable_star_observation", time, children=children)
+        # v2.x END
 
-        # add time and entry ID as items of the variable_star tag
-        variable_star_element.set("time", str(current_jd(time)))
-        variable_star_element.set("id", str(create_entry_id()))
 
-        # add the star-specific observation parameters as sub-tags of the variable_star tag, respectively
-        star_id_tag = ET.SubElement(variable_star_element, "star_id")
-        star_id_tag.text = str(star_id)
+# the logged parameters parse_session() hands on to the Session constructor. The filepath is always the one passed to
+# parse_session(), as the session directory may have been moved since
+_RESTORED_PARAMETERS = frozenset(Session._PARAM_KEYS) - {"filepath"}
 
-        magnitude_tag = ET.SubElement(variable_star_element, "magnitude")
-        magnitude_tag.text = str(magnitude)
 
-        chart_id_tag = ET.SubElement(variable_star_element, "chart_id")
-        chart_id_tag.text = str(chart_id)
+def _decode_flag(text: str) -> bool:
+    """
+    Converts the logged text of a boolean parameter back to ``bool``.
 
-        comparison_star_1_tag = ET.SubElement(variable_star_element, "comparison_star_1")
-        comparison_star_1_tag.text = str(comparison_star_1)
+    :param text: The logged text, "True" or "False".
+    :type text: ``str``
+
+    :return: Whether the text is "True".
+    :rtype: ``bool``
+    """
+    return text == "True"
+
+
+def _decode_measurement(text: str):
+    """
+    Converts the logged text of a condition measurement back to the ``int`` or ``float`` it was reported as.
+
+    :param text: The logged text, e.g. "5.0" or "1013".
+    :type text: ``str``
+
+    :return: The measurement.
+    :rtype: ``int`` or ``float``
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
 
-        if comparison_star_2 is not None:
-            comparison_star_2_tag = ET.SubElement(variable_star_element, "comparison_star_2")
-            comparison_star_2_tag.text = str(comparison_star_2)
 
-        codes_tag = ET.SubElement(variable_star_element, "observation_codes")
-        codes_tag.text = str(codes)
+def _decode_list(text: str):
+    """
+    Converts the logged text of a list parameter back to ``list``.
+
+    :param text: The logged text, e.g. "['telescope', 'camera']".
+    :type text: ``str``
+
+    :return: The list, or the unchanged text if its elements cannot be restored from their representation, e.g.
+        because they are dates.
+    :rtype: ``list`` or ``str``
+    """
+    try:
+        return literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+# every parameter that is not logged as a plain string, mapped to the callable converting its text back
+_PARAMETER_DECODERS = {
+    "started": _decode_flag,
+    "interrupted": _decode_flag,
+    "digitized": _decode_flag,
+    "longitude": float,
+    "latitude": float,
+    "listOfGear": _decode_list,
+    "temp": _decode_measurement,
+    "pressure": _decode_measurement,
+    "humidity": _decode_measurement,
+}
+
+
+def _decode_parameter(tag: str, text):
+    """
+    Converts the text of a logged parameter back to the value it was logged from.
+
+    :param tag: The name of the parameter.
+    :type tag: ``str``
+    :param text: The text of the parameter's tag.
+    :type text: ``str`` or ``None``
+
+    :return: The decoded value, or None if None was logged.
+    :rtype: any
+    """
+    if text is None or text == "None":
+        return None
+    decoder = _PARAMETER_DECODERS.get(tag)
+    return text if decoder is None else decoder(text)
 
-        # converting xml to a byte object...
-        session_byte = ET.tostring(session_root, encoding="UTF-8")
 
-        # ...then trying to write the file to memory, if we have permission to do so
+@lru_cache(maxsize=128)
+def _read_parameters(aop_path: str, aop_version: tuple, journal_version):
+    """
+    Reads the most recent parameters tag of a protocol, taking its journal into account.
+
+    Results are memoized, so that parsing the same session repeatedly only reads its protocol once. Since the
+    modification times and sizes of both files are part of the cache key, any change to them is picked up right away.
+
+    :param aop_path: The path to the .aop protocol.
+    :type aop_path: ``str``
+    :param aop_version: The modification time and size of the .aop protocol.
+    :type aop_version: ``tuple[int, int]``
+    :param journal_version: The modification time and size of the protocol's journal, or None if there is none.
+    :type journal_version: ``tuple[int, int]`` or ``None``
+
+    :raises FileNotFoundError: If there is no protocol at ``aop_path``.
+
+    :return: The serialized parameters tag, or None if the protocol is not well-formed or has no parameters tag. It
+        is returned as bytes, so the cached value cannot be modified.
+    :rtype: ``bytes`` or ``None``
+    """
+    # streaming through the log rather than building the whole tree, since only the parameters
+    # subelement is of interest. Every other child of the root is cleared as soon as it has been read...
+    parameters_xml = None
+    depth = 0
+    with open(aop_path, "rb") as protocol:
         try:
-            with open(f"{self.filepath}/{self.obsID}/{self.obsID}.aop", "wb") as f:
-                f.write(session_byte)
-        except PermissionError:
-            raise PermissionError("Error when writing to .aop: You do not have the adequate access rights!")
-        # v2.x END
+            for event, element in ET.iterparse(protocol, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1:
+                    if element.tag == "parameters":
+                        parameters_xml = element
+                    else:
+                        element.clear()
+        except ET.ParseError:
+            return None
+    # ...but a session that has not been ended yet may have journaled more recent parameters
+    if journal_version is not None:
+        try:
+            with open(f"{aop_path}.journal", "rb") as journal, _locked(journal, shared=True):
+                for line in journal:
+                    if line.startswith(b"<parameters"):
+                        try:
+                            parameters_xml = ET.fromstring(line)
+                        except ET.ParseError:
+                            # a line cut short by a crash cannot be recovered
+                            pass
+        except FileNotFoundError:
+            pass
+    return None if parameters_xml is None else ET.tostring(parameters_xml)
 
 
 def parse_session(filepath: str, session_id: str) -> Session:
@@ -1717,6 +2265,7 @@ def parse_session(filepath: str, session_id: str) -> Session:
     :raises AolNotFoundError: If there is no .aol legacy file using the specified filepath and observation ID.
     :raises SessionIdDoesntExistOnFilepathError: If the specified observation ID is not in the filepath provided.
     :raises NotADirectoryError: If the specified filepath does not constitute a directory.
+    :raises InvalidProtocolError: If the session's .aop file is not well-formed or lacks its parameters.
 
     :return: The new Session object parsed from the stored observation parameters.
         For all intents and purposes, this object is equivalent to the object
@@ -1764,40 +2313,62 @@ def parse_session(filepath: str, session_id: str) -> Session:
     # this is a helper-function allowing to extract the contents of an xml ElementTree into a dictionary.
     def extract_parameters(xml):
         parameters_dictionary = {}
-        # iterating through every element of the xml object...
-        for element in xml:
-            # if it has no more sub-elements, we can copy it into the dictionary, the tag being used as the key
-            # and the text as the value
-            if len(element) == 0:
-                parameters_dictionary[element.tag] = element.text
-            # if it has sub-elements, however, we're going to process them the same way, using recursion
-            else:
-                parameters_dictionary[element.tag] = extract_parameters(element)
+        # elements still to be processed, each with the dictionary their children are copied into
+        stack = [(parameters_dictionary, xml)]
+        while stack:
+            dictionary, node = stack.pop()
+            # iterating through every element of the xml object...
+            for element in node:
+                # ...skipping parameters the Session constructor would discard anyway, along with their sub-elements
+                if node is xml and element.tag not in _RESTORED_PARAMETERS:
+                    continue
+                # if it has no more sub-elements, we can copy it into the dictionary, the tag being used as the key
+                # and the text as the value
+                if len(element) == 0:
+                    value = element.text
+                    dictionary[element.tag] = _decode_parameter(element.tag, value) if node is xml else value
+                # if it has sub-elements, however, we're going to process them the same way later on, without
+                # recursion
+                else:
+                    dictionary[element.tag] = {}
+                    stack.append((dictionary[element.tag], element))
         return parameters_dictionary
 
-    # is the provided filepath actually a directory?
-    if path.isdir(filepath):
-        # is there a valid subdirectory for the observation/session ID provided?
-        if path.isdir(f"{filepath}/{session_id}"):
-            try:
-                # getting the root session element of the log...
-                tree = ET.parse(f"{filepath}/{session_id}/{session_id}.aop")
-                root = tree.getroot()
-                # ...finding the parameters subelement...
-                parameters_xml = root.find("parameters")
-                # ...extracting the information to a directory...
-                parameters_dict = extract_parameters(parameters_xml)
-                # ...adding the 'parsing' key to it so the Session constructor knows not
-                # to handle this as a brand-new session...
-                parameters_dict["parsing"] = True
-                # ...all before finally constructing and returning the new Session object...
-                session = Session(filepath, **parameters_dict)
-                return session
-            # ... except we somehow can't find the log file in the directory.
-            except FileNotFoundError:
-                raise AolNotFoundError(session_id)
-        else:
+    aop_path = path.join(filepath, session_id, f"{session_id}.aop")
+    try:
+        aop_stat = stat(aop_path)
+        try:
+            journal_stat = stat(f"{aop_path}.journal")
+            journal_version = (journal_stat.st_mtime_ns, journal_stat.st_size)
+        except FileNotFoundError:
+            journal_version = None
+        # the parameters are only read from disk if the protocol has changed since it was last parsed...
+        parameters = _read_parameters(aop_path, (aop_stat.st_mtime_ns, aop_stat.st_size), journal_version)
+    # ... except we somehow can't find the log file. Only now is it worth checking which part of the path is
+    # missing: is the provided filepath actually a directory, and is there a subdirectory for the observation ID?
+    except (FileNotFoundError, NotADirectoryError):
+        if not path.isdir(filepath):
+            raise NotADirectoryError("Your 'filepath' argument is not a directory.")
+        if not path.isdir(path.join(filepath, session_id)):
             raise SessionIDDoesntExistOnFilepathError(session_id)
+        raise AolNotFoundError(session_id)
+    # ...provided the protocol actually holds any...
+    if parameters is None:
+        raise InvalidProtocolError(session_id)
+    parameters_xml = ET.fromstring(parameters)
+    # ...extracting the information to a directory. The parameters tag written by aop is flat, which
+    # needs only a single sweep. Anything nested is left to the helper function...
+    if all(len(element) == 0 for element in parameters_xml):
+        parameters_dict = {element.tag: _decode_parameter(element.tag, element.text)
+                           for element in parameters_xml if element.tag in _RESTORED_PARAMETERS}
     else:
-        raise NotADirectoryError("Your 'filepath' argument is not a directory.")
+        parameters_dict = extract_parameters(parameters_xml)
+    # ...adding the 'parsing' key to it so the Session constructor knows not
+    # to handle this as a brand-new session...
+    parameters_dict["parsing"] = True
+    # ...all before finally constructing the new Session object. It remembers the .aop it was restored from, so
+    # that it refuses to log to it once another Session handle has ended or aborted the session
+    session = Session(filepath, **parameters_dict)
+    session._aop_id = _file_id(aop_stat)
+    return session
     # v2.x END
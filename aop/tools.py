@@ -5,10 +5,14 @@
 This module contains auxiliary classes and functions for the aop package.
 """
 
+import errno
 
-class AolFileAlreadyExistsError(Exception):
+
+class AolFileAlreadyExistsError(FileExistsError):
     """
     An error raised upon trying to initialize an .aol file that already exists.
+
+    Inherits from ``FileExistsError``, so it can be handled along with the errors raised by the operating system.
     """
 
     def __init__(self, filepath: str, session_id: str) -> None:
@@ -21,9 +25,19 @@ class AolFileAlreadyExistsError(Exception):
         :type session_id: ``str``
         """
 
+        super().__init__(errno.EEXIST, f".aol file of session {session_id} already exists", filepath)
         self.filepath = filepath
         self.session_id = session_id
 
+    def __reduce__(self) -> tuple:
+        """
+        Makes the error picklable and copyable, although ``OSError`` is handed other arguments than it takes.
+
+        :return: The class, the arguments to rebuild the error from and its attributes.
+        :rtype: ``tuple``
+        """
+        return type(self), (self.filepath, self.session_id), self.__dict__
+
 
 class AolNotFoundError(Exception):
     """
@@ -41,9 +55,38 @@ class AolNotFoundError(Exception):
         self.session_id = session_id
 
 
-class AopFileAlreadyExistsError(Exception):
+class InvalidProtocolError(Exception):
+    """
+    An error raised upon trying to load an .aop file that is no valid protocol, e.g. because it lacks its parameters.
+    """
+
+    def __init__(self, session_id: str) -> None:
+        """
+        Initialization of an InvalidProtocolError object.
+
+        :param session_id: The session_id used when the trouble happened.
+        :type session_id: ``str``
+        """
+
+        super().__init__(f"The .aop file of session {session_id} is no valid protocol.")
+        self.session_id = session_id
+
+    def __reduce__(self) -> tuple:
+        """
+        Makes the error picklable and copyable, although its message rather than its arguments is handed to
+        ``Exception``.
+
+        :return: The class, the arguments to rebuild the error from and its attributes.
+        :rtype: ``tuple``
+        """
+        return type(self), (self.session_id,), self.__dict__
+
+
+class AopFileAlreadyExistsError(FileExistsError):
     """
     An error raised upon trying to initialize an .aop file that already exists.
+
+    Inherits from ``FileExistsError``, so it can be handled along with the errors raised by the operating system.
     """
 
     def __init__(self, filepath: str, session_id: str) -> None:
@@ -56,9 +99,19 @@ class AopFileAlreadyExistsError(Exception):
         :type session_id: ``str``
         """
 
+        super().__init__(errno.EEXIST, f".aop file of session {session_id} already exists", filepath)
         self.filepath = filepath
         self.session_id = session_id
 
+    def __reduce__(self) -> tuple:
+        """
+        Makes the error picklable and copyable, although ``OSError`` is handed other arguments than it takes.
+
+        :return: The class, the arguments to rebuild the error from and its attributes.
+        :rtype: ``tuple``
+        """
+        return type(self), (self.filepath, self.session_id), self.__dict__
+
 
 class InvalidTimeStringError(Exception):
     """
@@ -108,18 +161,22 @@ class SessionStateError(Exception):
         :type state: ``str``
         """
 
+        # the error message is built once and handed to Exception, whose __str__ simply returns it
+        super().__init__(f"Not able to {event}: session currently {state}.")
         self.event = event
         self.state = state
 
-    def __str__(self) -> str:
+    def __reduce__(self) -> tuple:
         """
-        The default custom error message of SessionStateError
+        Makes the error picklable and copyable, although its message rather than its arguments is handed to
+        ``Exception``.
 
-        :return: default custom error message
-        :rtype: ``str``
+        :return: The class, the arguments to rebuild the error from and its attributes.
+        :rtype: ``tuple``
         """
-
-        return f"Not able to {self.event}: session currently {self.state}."
+        # the subclasses below always name the same event and state, so they are rebuilt without any arguments
+        arguments = (self.event, self.state) if type(self).__init__ is SessionStateError.__init__ else ()
+        return type(self), arguments, self.__dict__
 
 
 class NotInterruptableError(SessionStateError):
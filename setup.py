@@ -1,12 +1,4 @@
 from setuptools import setup
 
-setup(name="aop",
-      version="2.0",
-      description="A package for amateur astronomical observation logs",
-      download_url="https://github.com/NinaTolfersheimer/aop",
-      url="https://ninatolfersheimer.github.io/aop",
-      author="Amélie Solveigh Hohe",
-      author_email="nina.tolfersheimer@posteo.de",
-      license="MIT",
-      packages=["aop"],
-      zip_safe=False)
+# the package metadata lives in pyproject.toml, this file is only kept for tools still calling setup.py directly
+setup()
@@ -0,0 +1,164 @@
+"""
+Tests of the .aop protocol as written by :class:`aop.aop.Session`, including its journal and sessions shared by
+several Session handles.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from datetime import date
+
+from aop import aop
+
+
+def events(session):
+    """
+    Returns the tags of the events in the .aop of a session, comments along with their text.
+    """
+    root = ET.parse(f"{session._path_stem}.aop").getroot()
+    return [f"comment={element.text}" if element.tag == "comment" else element.tag
+            for element in root if element.tag != "parameters"]
+
+
+class ProtocolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filepath = self.directory.name
+
+    def test_round_trip(self):
+        session = aop.Session(self.filepath, name="Test", longitude=12.5, latitude="-45.25", digitized=False,
+                              listOfGear=["telescope", 3])
+        session.start()
+        session.comment("first")
+        session.condition_report(description="clear", temp=5, pressure=1013.5, humidity=40)
+        session.interrupt()
+
+        restored = aop.parse_session(self.filepath, session.obsID)
+        self.assertEqual(restored.obsID, session.obsID)
+        self.assertEqual(restored.name, "Test")
+        self.assertEqual(restored.longitude, 12.5)
+        self.assertEqual(restored.latitude, -45.25)
+        self.assertIs(restored.digitized, False)
+        self.assertEqual(restored.listOfGear, ["telescope", 3])
+        self.assertIs(restored.state, aop.SessionState.RUNNING)
+        self.assertIs(restored.interrupted, True)
+        self.assertIs(restored.started, True)
+        self.assertEqual((restored.conditionDescription, restored.temp, restored.pressure, restored.humidity),
+                         ("clear", 5, 1013.5, 40))
+
+        restored.resume()
+        restored.comment("second")
+        restored.end()
+        self.assertEqual(events(session), ["start", "comment=first", "condition_description", "temperature",
+                                           "pressure", "humidity", "interrupt", "resume", "comment=second", "end"])
+        self.assertFalse(os.path.exists(f"{session._path_stem}.aop.journal"))
+        self.assertFalse(os.path.exists(f"{session._path_stem}.aop.tmp"))
+
+    def test_list_of_gear_that_cannot_be_decoded(self):
+        session = aop.Session(self.filepath, listOfGear=["telescope", date(2024, 1, 1)])
+        session.start()
+        restored = aop.parse_session(self.filepath, session.obsID)
+        self.assertEqual(restored.listOfGear, "['telescope', datetime.date(2024, 1, 1)]")
+        restored.end()
+        root = ET.parse(f"{session._path_stem}.aop").getroot()
+        self.assertEqual(root.find("parameters/listOfGear").text, "['telescope', datetime.date(2024, 1, 1)]")
+
+    def test_events_are_written_to_the_journal_right_away(self):
+        session = aop.Session(self.filepath)
+        session.start()
+        session.comment("A")
+        session.comment("B")
+        with open(f"{session._path_stem}.aop.journal", "rb") as journal:
+            self.assertEqual(journal.read().count(b"<comment"), 2)
+        session.flush()
+        self.assertFalse(session._dirty)
+        session.end()
+
+    def test_journal_is_replayed_after_a_crash(self):
+        # os._exit() skips garbage collection and atexit handlers, just like a crash of the implementing app
+        script = ("import os, sys\n"
+                  "from aop import aop\n"
+                  "session = aop.Session(sys.argv[1])\n"
+                  "session.start()\n"
+                  "session.comment('before the crash')\n"
+                  "session.interrupt()\n"
+                  "print(session.obsID, flush=True)\n"
+                  "os._exit(1)\n")
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", script, self.filepath], capture_output=True, text=True,
+                                cwd=package, check=False)
+        obs_id = result.stdout.strip()
+
+        restored = aop.parse_session(self.filepath, obs_id)
+        self.assertIs(restored.interrupted, True)
+        restored.resume()
+        restored.end()
+        self.assertEqual(events(restored), ["start", "comment=before the crash", "interrupt", "resume", "end"])
+
+    def test_starting_again_begins_a_new_protocol(self):
+        session = aop.Session(self.filepath)
+        session.start()
+        session.comment("first")
+        first = session._path_stem
+        session.start()
+        session.comment("second")
+        session.end()
+        self.assertNotEqual(session._path_stem, first)
+        self.assertEqual(events(session), ["start", "comment=second", "end"])
+        root = ET.parse(f"{session._path_stem}.aop").getroot()
+        self.assertEqual(root.find("parameters/obsID").text, session.obsID)
+
+    def test_leap_second(self):
+        session = aop.Session(self.filepath)
+        session.start()
+        session.comment("leap second", time="2016-12-31T23:59:60")
+        session.end()
+        self.assertIn("comment=leap second", events(session))
+
+
+class SharedSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.session = aop.Session(self.directory.name)
+        self.session.start()
+
+    def restore(self):
+        return aop.parse_session(self.directory.name, self.session.obsID)
+
+    def test_events_of_both_handles_are_composed(self):
+        other = self.restore()
+        self.session.comment("one")
+        other.comment("two")
+        self.session.comment("three")
+        other.end()
+        self.assertEqual(events(self.session), ["start", "comment=one", "comment=two", "comment=three", "end"])
+
+    def test_handle_refuses_to_log_after_the_other_ended_the_session(self):
+        other = self.restore()
+        other.comment("logged")
+        self.session.end()
+        with self.assertRaises(aop.SessionStateError):
+            other.comment("late")
+        self.assertEqual(events(self.session), ["start", "comment=logged", "end"])
+        self.assertFalse(os.path.exists(f"{self.session._path_stem}.aop.journal"))
+
+    def test_handle_restored_before_the_end_refuses_to_log(self):
+        other = self.restore()
+        self.session.end()
+        with self.assertRaises(aop.SessionStateError):
+            other.comment("late")
+        with self.assertRaises(aop.SessionStateError):
+            other.end()
+        self.assertEqual(events(self.session), ["start", "end"])
+        self.assertFalse(os.path.exists(f"{self.session._path_stem}.aop.journal"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Regression tests making sure the exceptions raised by :mod:`aop.aop` are the classes defined in :mod:`aop.tools`,
+so that they can be caught using either module's names.
+"""
+
+import copy
+import pickle
+import tempfile
+import unittest
+
+from aop import aop, tools
+
+
+class ExceptionClassesTest(unittest.TestCase):
+
+    def test_aop_uses_the_classes_of_tools(self):
+        for name in ("AolFileAlreadyExistsError", "AolNotFoundError", "AopFileAlreadyExistsError",
+                     "InvalidProtocolError", "InvalidTimeStringError", "SessionIDDoesntExistOnFilepathError",
+                     "SessionStateError", "NotInterruptableError", "NotResumableError", "NotAbortableError",
+                     "NotEndableError", "AlreadyInterruptedError", "NotInterruptedError", "SessionNotStartedError"):
+            with self.subTest(name=name):
+                self.assertIs(getattr(aop, name), getattr(tools, name))
+
+    def test_exceptions_keep_their_arguments(self):
+        cases = [
+            (aop.AolFileAlreadyExistsError("/logs", "x"), {"filepath": "/logs", "session_id": "x"}),
+            (aop.AopFileAlreadyExistsError("/logs", "x"), {"filepath": "/logs", "session_id": "x"}),
+            (aop.AolNotFoundError("x"), {"session_id": "x"}),
+            (aop.InvalidProtocolError("x"), {"session_id": "x"}),
+            (aop.InvalidTimeStringError("x"), {"invalid_string": "x"}),
+            (aop.SessionIDDoesntExistOnFilepathError("x"), {"invalid_id": "x"}),
+            (aop.SessionStateError(event="x", state="y"), {"event": "x", "state": "y"}),
+            (aop.NotInterruptableError(), {"event": "interrupt session"}),
+            (aop.NotResumableError(), {"event": "resume session"}),
+            (aop.NotAbortableError(), {"event": "abort session"}),
+            (aop.NotEndableError(), {"event": "end session"}),
+            (aop.AlreadyInterruptedError(), {"state": "interrupted"}),
+            (aop.NotInterruptedError(), {"state": "not interrupted"}),
+            (aop.SessionNotStartedError("x"), {"illegal_operation": "x"}),
+        ]
+        for error, attributes in cases:
+            with self.subTest(error=type(error).__name__):
+                with self.assertRaises(getattr(tools, type(error).__name__)) as context:
+                    raise error
+                for attribute, value in attributes.items():
+                    self.assertEqual(getattr(context.exception, attribute), value)
+
+    def test_session_state_errors_survive_pickling_and_copying(self):
+        for error in (aop.SessionStateError("x", "y"), aop.SessionStateError(event="x", state="y"),
+                      aop.NotInterruptableError(), aop.NotResumableError(), aop.NotAbortableError(),
+                      aop.NotEndableError(), aop.AlreadyInterruptedError(), aop.NotInterruptedError()):
+            for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+                with self.subTest(error=type(error).__name__):
+                    self.assertIs(type(restored), type(error))
+                    self.assertEqual(str(restored), str(error))
+                    self.assertEqual((restored.event, restored.state), (error.event, error.state))
+
+    def test_file_exists_errors_survive_pickling_and_copying(self):
+        for error in (aop.AolFileAlreadyExistsError("/logs", "x"), aop.AopFileAlreadyExistsError("/logs", "x")):
+            for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+                with self.subTest(error=type(error).__name__):
+                    self.assertIs(type(restored), type(error))
+                    self.assertEqual(str(restored), str(error))
+                    self.assertEqual((restored.filepath, restored.session_id), ("/logs", "x"))
+
+    def test_invalid_protocol_error_survives_pickling_and_copying(self):
+        error = aop.InvalidProtocolError("x")
+        for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+            self.assertEqual(str(restored), str(error))
+            self.assertEqual(restored.session_id, "x")
+
+    def test_file_exists_errors_are_file_exists_errors(self):
+        with self.assertRaises(FileExistsError):
+            raise aop.AopFileAlreadyExistsError("/logs", "x")
+
+    def test_errors_raised_by_aop_are_caught_as_tools_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(tools.SessionIDDoesntExistOnFilepathError):
+                aop.parse_session(directory, "missing")
+            session = aop.Session(directory)
+            with self.assertRaises(tools.SessionNotStartedError):
+                session.comment("too early")
+            session.start()
+            session.end()
+            with self.assertRaises(tools.SessionStateError):
+                session.comment("too late")
+            with self.assertRaises(tools.NotEndableError):
+                session.end()
+        with self.assertRaises(tools.InvalidTimeStringError):
+            aop.current_jd("not a time")
+
+
+if __name__ == "__main__":
+    unittest.main()